@@ -8,24 +8,60 @@ if essential context is missing and must be requested from the user.
 Functions:
     clarify_research_needs: Determines if essential context is needed
                             or if research can proceed
+    aclarify_research_needs: Async variant of clarify_research_needs
+    prepare_messages: Build the clarifier request messages for a conversation
+    llm_params: Build the call_llm keyword arguments for a clarifier request
+    parse_decision: Extract and validate the decision from a tool-call response
 
 Dependencies:
-    - json
     - logging
+    - orjson
     - OpenAI connector for LLM calls
+    - Agent response cache
+    - Clarifier fast path
 """
 
-import json
+import asyncio
 import logging
+import re
+import weakref
+from functools import lru_cache
+
+import orjson
 
 from ...chat_model.model_settings import get_model_config
-from ...llm_connectors.rbc_openai import call_llm
+from ...llm_connectors.rbc_openai import (
+    OpenAIConnectorError,
+    acall_llm,
+    cacheable_system_message,
+    call_llm,
+)
+from ..response_cache import (
+    DiskResponseCache,
+    ResponseCache,
+    SemanticResponseCache,
+    make_cache_key,
+)
+from .fast_path import detect_continuation, fast_path_decision
 from .clarifier_settings import (
+    CACHE_MAX_ENTRIES,
+    CACHE_TTL_SECONDS,
+    CLARIFIER_CONCURRENCY,
+    DB_ALIASES,
+    DISK_CACHE_DIR,
+    DISK_CACHE_ENABLED,
+    DISK_CACHE_TTL_SECONDS,
+    FAST_PATH_ENABLED,
     MAX_TOKENS,
     MODEL_CAPABILITY,
-    SYSTEM_PROMPT,
+    PROMPT_VARIANT_CACHE_SIZE,
+    SEMANTIC_CACHE_ENABLED,
+    SEMANTIC_CACHE_THRESHOLD,
     TEMPERATURE,
     TOOL_DEFINITIONS,
+    TOOL_DEFINITIONS_JSON,
+    construct_dynamic_context,
+    construct_system_prompt,
 )
 
 # Get module logger (no configuration here - using centralized config)
@@ -37,6 +73,60 @@ MODEL_NAME = model_config["name"]
 PROMPT_TOKEN_COST = model_config["prompt_token_cost"]
 COMPLETION_TOKEN_COST = model_config["completion_token_cost"]
 
+# Force the model to answer through the clarifier decision tool
+TOOL_CHOICE = {
+    "type": "function",
+    "function": {"name": "make_clarifier_decision"},
+}
+
+# Allowed decision values, taken from the tool schema so the two cannot drift
+_DECISION_PROPERTIES = TOOL_DEFINITIONS[0]["function"]["parameters"]["properties"]
+VALID_ACTIONS = frozenset(_DECISION_PROPERTIES["action"]["enum"])
+VALID_SCOPES = frozenset(_DECISION_PROPERTIES["scope"]["enum"])
+
+# Exact-match decision cache, only consulted for deterministic (temperature 0) calls
+_decision_cache = ResponseCache(
+    max_entries=CACHE_MAX_ENTRIES, default_ttl=CACHE_TTL_SECONDS
+)
+
+# Persistent exact-match cache consulted after an in-memory miss
+_disk_cache = (
+    DiskResponseCache(DISK_CACHE_DIR, default_ttl=DISK_CACHE_TTL_SECONDS)
+    if DISK_CACHE_ENABLED
+    else None
+)
+
+# Explicit continuation phrasing depends on the preceding exchange, so it is never
+# matched against decisions cached for other conversations
+_CONTINUATION_PATTERN = re.compile(
+    r"\b(?:continue|proceed|go ahead|here(?:'s| is) the)\b", re.IGNORECASE
+)
+
+# Near-duplicate cache for rephrasings of the latest user message (opt-in)
+_semantic_cache = (
+    SemanticResponseCache(
+        threshold=SEMANTIC_CACHE_THRESHOLD,
+        max_entries=CACHE_MAX_ENTRIES,
+        default_ttl=CACHE_TTL_SECONDS,
+        bypass_pattern=_CONTINUATION_PATTERN,
+    )
+    if SEMANTIC_CACHE_ENABLED
+    else None
+)
+
+
+# Matches any database alias as a whole word or phrase
+_DB_ALIAS_PATTERN = re.compile(
+    r"\b(?:"
+    + "|".join(re.escape(alias) for alias in sorted(DB_ALIASES, key=len, reverse=True))
+    + r")\b",
+    re.IGNORECASE,
+)
+
+# Semaphores capping concurrent async clarifier calls, one per event loop since
+# an asyncio.Semaphore cannot be shared between loops
+_semaphores: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
 
 class ClarifierError(Exception):
     """Base exception class for clarifier-related errors."""
@@ -44,6 +134,214 @@ class ClarifierError(Exception):
     pass
 
 
+@lru_cache(maxsize=PROMPT_VARIANT_CACHE_SIZE)
+def _system_message(database_ids=None):
+    """
+    Build the system message for a database selection on first use.
+
+    The dict is never mutated: the OpenAI client and the cache key builder only
+    read it, so one instance serves all calls with the same selection.
+    """
+    return cacheable_system_message(construct_system_prompt(database_ids))
+
+
+def _requested_databases(messages):
+    """
+    Find the databases named in the latest user message.
+
+    Returns:
+        tuple or None: Sorted ids of the named databases, or None if the message
+            names none and every database description should be sent
+    """
+    if not messages or messages[-1].get("role") != "user":
+        return None
+    text = messages[-1].get("content")
+    if not isinstance(text, str):
+        return None
+
+    database_ids = {
+        DB_ALIASES[match.lower()] for match in _DB_ALIAS_PATTERN.findall(text)
+    }
+    return tuple(sorted(database_ids)) or None
+
+
+def _concurrency_limit():
+    """Get the semaphore limiting concurrent clarifier calls on the running loop."""
+    loop = asyncio.get_running_loop()
+    semaphore = _semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _semaphores[loop] = asyncio.Semaphore(CLARIFIER_CONCURRENCY)
+    return semaphore
+
+
+def prepare_messages(conversation):
+    """
+    Prepend the clarifier system prompt to the conversation messages.
+
+    The static system prompt always comes first so the request prefix stays
+    byte-identical; the date-dependent context follows it in its own message.
+    When the user names specific databases, only their descriptions are included.
+    """
+    conversation_messages = (conversation or {}).get("messages", [])
+    database_ids = _requested_databases(conversation_messages)
+    dynamic_message = {"role": "system", "content": construct_dynamic_context()}
+    return [
+        _system_message(database_ids),
+        dynamic_message,
+        *conversation_messages,
+    ]
+
+
+def _get_cached_decision(messages):
+    """
+    Look up a cached decision for deterministic clarifier requests.
+
+    Returns:
+        tuple: (cache_key, cached_decision). cache_key is None when caching is
+            disabled; cached_decision is None on a cache miss.
+    """
+    if TEMPERATURE != 0.0:
+        return None, None
+
+    cache_key = make_cache_key(MODEL_NAME, messages, TOOL_DEFINITIONS_JSON, TOOL_CHOICE)
+    cached_decision = _decision_cache.get(cache_key)
+    if cached_decision is None and _disk_cache is not None:
+        cached_decision = _disk_cache.get(cache_key)
+        if cached_decision is not None:
+            _decision_cache.set(cache_key, cached_decision)
+    if cached_decision is None and _semantic_cache is not None:
+        cached_decision = _semantic_cache.get(MODEL_NAME, messages)
+        if cached_decision is not None:
+            _decision_cache.set(cache_key, cached_decision)
+    if cached_decision is not None:
+        logger.info(
+            f"Clarifier decision served from cache: {cached_decision['action']}"
+        )
+    return cache_key, cached_decision
+
+
+def _store_decision(cache_key, messages, decision):
+    """Store a fresh decision in the response caches."""
+    if cache_key is not None:
+        _decision_cache.set(cache_key, decision, ttl=CACHE_TTL_SECONDS)
+        if _semantic_cache is not None:
+            _semantic_cache.set(MODEL_NAME, messages, decision, ttl=CACHE_TTL_SECONDS)
+        if _disk_cache is not None:
+            _disk_cache.set(cache_key, decision)
+
+
+def parse_decision(response, messages):
+    """
+    Extract and validate the clarifier decision from a tool-call response.
+
+    Args:
+        response: Chat completion response containing the tool call
+        messages (list): Messages the response was generated for
+
+    Returns:
+        dict: Clarifier decision with action, output, scope and is_continuation
+
+    Raises:
+        ClarifierError: If the response does not contain a valid decision
+    """
+    # Extract the tool call from the response
+    try:
+        tool_call = response.choices[0].message.tool_calls[0]
+    except (AttributeError, IndexError, TypeError):
+        raise ClarifierError("No tool call received in response")
+    if tool_call is None:
+        raise ClarifierError("No tool call received in response")
+    return _validate_tool_call(
+        tool_call.function.name, tool_call.function.arguments, messages
+    )
+
+
+def _validate_tool_call(name, raw_arguments, messages):
+    """
+    Validate a make_clarifier_decision tool call and build the decision dict.
+
+    Continuation is not part of the tool call; it is detected locally from the
+    conversation.
+
+    Args:
+        name (str): Name of the function the model called
+        raw_arguments (str): JSON-encoded tool call arguments
+        messages (list): Messages the tool call was generated for
+
+    Raises:
+        ClarifierError: If the tool call does not contain a valid decision
+    """
+    # Verify that the correct function was called
+    if name != "make_clarifier_decision":
+        raise ClarifierError(f"Unexpected function call: {name}")
+
+    # Parse the arguments
+    try:
+        arguments = orjson.loads(raw_arguments)
+    except orjson.JSONDecodeError as e:
+        raise ClarifierError(f"Invalid JSON in tool arguments: {raw_arguments}") from e
+
+    if not isinstance(arguments, dict):
+        raise ClarifierError(f"Tool arguments must be an object, got: {arguments}")
+
+    # Validate all decision fields against the tool schema in one pass
+    action = arguments.get("action")
+    output = arguments.get("output")
+    scope = arguments.get("scope")
+    is_continuation = detect_continuation(messages)
+
+    if action not in VALID_ACTIONS:
+        raise ClarifierError(
+            f"Invalid 'action' in tool arguments: {action}. "
+            f"Must be one of {sorted(VALID_ACTIONS)}."
+        )
+    if not output or not isinstance(output, str):
+        raise ClarifierError("Missing 'output' in tool arguments")
+
+    # Scope is required only when creating a research statement
+    if action == "create_research_statement":
+        if scope not in VALID_SCOPES:
+            raise ClarifierError(
+                f"Invalid 'scope' value: {scope}. Must be 'metadata' or 'research'."
+            )
+    elif scope:
+        logger.warning(
+            f"Scope '{scope}' provided but action is '{action}'. Scope will be ignored."
+        )
+        scope = None
+
+    # Log the clarifier decision
+    logger.info(f"Clarifier decision: {action}")
+    if action == "create_research_statement":
+        logger.info(f"Determined scope: {scope}")
+    logger.info(f"Is continuation: {is_continuation}")
+
+    decision = {
+        "action": action,
+        "output": output,
+        "scope": scope,
+        "is_continuation": is_continuation,
+    }
+
+    return decision
+
+
+def llm_params(messages, token):
+    """Build the call_llm/acall_llm keyword arguments for a clarifier request."""
+    return dict(
+        oauth_token=token,
+        model=MODEL_NAME,
+        messages=messages,
+        max_tokens=MAX_TOKENS,
+        temperature=TEMPERATURE,
+        tools=TOOL_DEFINITIONS,
+        tool_choice=TOOL_CHOICE,
+        stream=False,
+        prompt_token_cost=PROMPT_TOKEN_COST,
+        completion_token_cost=COMPLETION_TOKEN_COST,
+    )
+
+
 def clarify_research_needs(conversation, token):
     """
     Determine if essential context is needed or create a research statement.
@@ -61,102 +359,75 @@ def clarify_research_needs(conversation, token):
             - is_continuation: Whether this is a continuation of previous research
 
     Raises:
-        ClarifierError: If there is an error in the clarification process
+        ClarifierError: If the LLM call fails or returns no valid decision
     """
+    # Decide obvious requests locally without an LLM call
+    if FAST_PATH_ENABLED:
+        decision = fast_path_decision(conversation)
+        if decision is not None:
+            return decision
+
+    messages = prepare_messages(conversation)
+
+    # Serve identical deterministic requests from the cache
+    cache_key, cached_decision = _get_cached_decision(messages)
+    if cached_decision is not None:
+        return cached_decision
+
+    logger.info(f"Clarifying research needs using model: {MODEL_NAME}")
+    logger.info("Initiating Clarifier API call")  # Added contextual log
+
+    # Make the API call with tool calling
     try:
-        # Prepare system message with clarifier prompt
-        system_message = {"role": "system", "content": SYSTEM_PROMPT}
-
-        # Prepare messages for the API call
-        messages = [system_message]
-        if conversation and "messages" in conversation:
-            messages.extend(conversation["messages"])
-
-        logger.info(f"Clarifying research needs using model: {MODEL_NAME}")
-        logger.info("Initiating Clarifier API call")  # Added contextual log
-
-        # Make the API call with tool calling
-        response = call_llm(
-            oauth_token=token,
-            model=MODEL_NAME,
-            messages=messages,
-            max_tokens=MAX_TOKENS,
-            temperature=TEMPERATURE,
-            tools=TOOL_DEFINITIONS,
-            tool_choice={
-                "type": "function",
-                "function": {"name": "make_clarifier_decision"},
-            },
-            stream=False,
-            prompt_token_cost=PROMPT_TOKEN_COST,
-            completion_token_cost=COMPLETION_TOKEN_COST,
-        )
+        response = call_llm(**llm_params(messages, token))
+    except OpenAIConnectorError as e:
+        logger.error(f"Error clarifying research needs: {str(e)}")
+        raise ClarifierError(f"Failed to clarify research needs: {str(e)}") from e
+    decision = parse_decision(response, messages)
 
-        # Extract the tool call from the response
-        if (
-            not response.choices
-            or not response.choices[0].message
-            or not response.choices[0].message.tool_calls
-            or not response.choices[0].message.tool_calls[0]
-        ):
-            raise ClarifierError("No tool call received in response")
+    _store_decision(cache_key, messages, decision)
+    return decision
 
-        tool_call = response.choices[0].message.tool_calls[0]
 
-        # Verify that the correct function was called
-        if tool_call.function.name != "make_clarifier_decision":
-            raise ClarifierError(f"Unexpected function call: {tool_call.function.name}")
+async def aclarify_research_needs(conversation, token):
+    """
+    Asynchronous variant of clarify_research_needs.
+
+    Awaits the LLM call on the async client so other agents or sessions can run
+    on the event loop while the request is in flight.
+
+    Args:
+        conversation (dict): Conversation with 'messages' key
+        token (str): Authentication token for API access
+
+    Returns:
+        dict: Clarifier decision (see clarify_research_needs)
+
+    Raises:
+        ClarifierError: If the LLM call fails or returns no valid decision
+    """
+    # Decide obvious requests locally without an LLM call
+    if FAST_PATH_ENABLED:
+        decision = fast_path_decision(conversation)
+        if decision is not None:
+            return decision
+
+    messages = prepare_messages(conversation)
 
-        # Parse the arguments
+    cache_key, cached_decision = _get_cached_decision(messages)
+    if cached_decision is not None:
+        return cached_decision
+
+    logger.info(f"Clarifying research needs (async) using model: {MODEL_NAME}")
+
+    # Keep simultaneous requests within the provider's rate limits
+    async with _concurrency_limit():
         try:
-            arguments = json.loads(tool_call.function.arguments)
-        except json.JSONDecodeError:
-            raise ClarifierError(
-                f"Invalid JSON in tool arguments: {tool_call.function.arguments}"
-            )
+            response = await acall_llm(**llm_params(messages, token))
+        except OpenAIConnectorError as e:
+            logger.error(f"Error clarifying research needs: {str(e)}")
+            raise ClarifierError(f"Failed to clarify research needs: {str(e)}") from e
+    decision = parse_decision(response, messages)
 
-        # Extract decision fields
-        action = arguments.get("action")
-        output = arguments.get("output")
-        scope = arguments.get("scope")  # Extract the new scope field
-        is_continuation = arguments.get("is_continuation", False)
-
-        if not action:
-            raise ClarifierError("Missing 'action' in tool arguments")
-
-        if not output:
-            raise ClarifierError("Missing 'output' in tool arguments")
-
-        # Validate scope: required only when creating a research statement
-        if action == "create_research_statement":
-            if not scope:
-                raise ClarifierError(
-                    "Missing 'scope' in tool arguments when action is 'create_research_statement'"
-                )
-            if scope not in ["metadata", "research"]:
-                raise ClarifierError(
-                    f"Invalid 'scope' value: {scope}. Must be 'metadata' or 'research'."
-                )
-        elif scope:
-            # Scope should not be provided if action is request_essential_context
-            logger.warning(
-                f"Scope '{scope}' provided but action is '{action}'. Scope will be ignored."
-            )
-            scope = None  # Ensure scope is None if not applicable
-
-        # Log the clarifier decision
-        logger.info(f"Clarifier decision: {action}")
-        if action == "create_research_statement":
-            logger.info(f"Determined scope: {scope}")
-        logger.info(f"Is continuation: {is_continuation}")
-
-        return {
-            "action": action,
-            "output": output,
-            "scope": scope,  # Include scope in the return dictionary
-            "is_continuation": is_continuation,
-        }
-
-    except Exception as e:
-        logger.error(f"Error clarifying research needs: {str(e)}")
-        raise ClarifierError(f"Failed to clarify research needs: {str(e)}")
+    _store_decision(cache_key, messages, decision)
+    return decision
@@ -0,0 +1,155 @@
+# python/iris/src/agents/agent_clarifier/clarifier_batch.py
+"""
+Clarifier Batch Module
+
+This module runs the clarifier over many conversations at once for evaluation,
+replay and labelling workloads. Two paths are provided: a concurrent path that
+fans requests out over the async client when results are needed promptly, and
+an offline path that submits all requests as a single Batch API job, trading
+latency for the reduced batch pricing.
+
+Functions:
+    aclarify_research_needs_batch: Clarify conversations concurrently
+    clarify_research_needs_batch: Synchronous wrapper for scripts and backfills
+    submit_clarifier_batch: Upload conversations as a Batch API job
+    collect_clarifier_batch: Wait for a Batch API job and parse its decisions
+
+Dependencies:
+    - asyncio
+    - logging
+    - OpenAI batch connector
+"""
+
+import asyncio
+import logging
+
+from ...llm_connectors.openai_batch import collect_batch, submit_batch
+from ...llm_connectors.rbc_openai import OpenAIConnectorError
+from .clarifier import (
+    ClarifierError,
+    aclarify_research_needs,
+    llm_params,
+    parse_decision,
+    prepare_messages,
+)
+from .clarifier_settings import (
+    BATCH_COMPLETION_WINDOW,
+    BATCH_MAX_WAIT_SECONDS,
+    BATCH_POLL_INTERVAL_SECONDS,
+    CLARIFIER_CONCURRENCY,
+)
+
+# Get module logger (no configuration here - using centralized config)
+logger = logging.getLogger(__name__)
+
+
+async def aclarify_research_needs_batch(conversations, token):
+    """
+    Clarify many conversations concurrently.
+
+    The number of requests in flight is capped by CLARIFIER_CONCURRENCY, which
+    aclarify_research_needs applies to every async call on the event loop.
+
+    Args:
+        conversations (list): Conversations, each a dict with a 'messages' key
+        token (str): Authentication token for API access
+
+    Returns:
+        list: One entry per conversation, in input order. Each entry is either
+            the clarifier decision dict or the ClarifierError raised for it.
+    """
+
+    async def _clarify(conversation):
+        try:
+            return await aclarify_research_needs(conversation, token)
+        except ClarifierError as e:
+            return e
+
+    logger.info(
+        f"Clarifying {len(conversations)} conversations "
+        f"(concurrency limit: {CLARIFIER_CONCURRENCY})"
+    )
+    return await asyncio.gather(*(_clarify(c) for c in conversations))
+
+
+def clarify_research_needs_batch(conversations, token):
+    """
+    Synchronous wrapper around aclarify_research_needs_batch.
+
+    Intended for scripts and backfills; it starts its own event loop, so
+    callers already running inside one should await the async variant instead.
+
+    Args:
+        conversations (list): Conversations, each a dict with a 'messages' key
+        token (str): Authentication token for API access
+
+    Returns:
+        list: Decisions or ClarifierError instances, in input order
+    """
+    return asyncio.run(aclarify_research_needs_batch(conversations, token))
+
+
+def submit_clarifier_batch(conversations, token):
+    """
+    Upload conversations as a Batch API job.
+
+    Args:
+        conversations (list): Conversations, each a dict with a 'messages' key
+        token (str): Authentication token for API access
+
+    Returns:
+        str: ID of the created batch job
+    """
+    return submit_batch(
+        "clarifier",
+        [
+            llm_params(prepare_messages(conversation), token)
+            for conversation in conversations
+        ],
+        token,
+        BATCH_COMPLETION_WINDOW,
+    )
+
+
+def collect_clarifier_batch(
+    batch_id,
+    token,
+    conversations,
+    poll_interval=BATCH_POLL_INTERVAL_SECONDS,
+    max_wait=BATCH_MAX_WAIT_SECONDS,
+):
+    """
+    Wait for a Batch API job to finish and parse its clarifier decisions.
+
+    Args:
+        batch_id (str): ID returned by submit_clarifier_batch
+        token (str): Authentication token for API access
+        conversations (list): The conversations submitted in the batch, in order
+        poll_interval (int): Seconds between status checks
+        max_wait (int): Seconds to wait for the job before giving up
+
+    Returns:
+        list: One entry per submitted conversation, in input order. Each entry
+            is either the clarifier decision dict or a ClarifierError.
+
+    Raises:
+        ClarifierError: If the batch job ends without producing output or
+            is still running after max_wait seconds
+    """
+    try:
+        completions = collect_batch(
+            "clarifier", batch_id, token, len(conversations), poll_interval, max_wait
+        )
+    except OpenAIConnectorError as e:
+        raise ClarifierError(str(e)) from e
+
+    results = []
+    for conversation, completion in zip(conversations, completions):
+        if isinstance(completion, OpenAIConnectorError):
+            results.append(ClarifierError(str(completion)))
+            continue
+        try:
+            results.append(parse_decision(completion, prepare_messages(conversation)))
+        except ClarifierError as e:
+            results.append(e)
+    return results
@@ -15,16 +15,69 @@ Attributes:
     MODEL_CAPABILITY (str): The model capability to use ('small' or 'large')
     MAX_TOKENS (int): Maximum tokens for model response
     TEMPERATURE (float): Randomness parameter (0-1)
-    SYSTEM_PROMPT (str): System prompt template defining the clarifier role
+    FAST_PATH_ENABLED (bool): Whether obvious requests are decided by local
+        rules without an LLM call
+    DB_ALIASES (dict): Phrases naming a database in a user message, mapped to
+        the database id whose description is sent when it is named
+    PROMPT_VARIANT_CACHE_SIZE (int): Maximum number of database-specific
+        system prompt variants kept in memory
+    CACHE_MAX_ENTRIES (int): Maximum number of decisions held in the response cache
+    CACHE_TTL_SECONDS (int): Time-to-live in seconds for cached decisions
+    SEMANTIC_CACHE_ENABLED (bool): Whether decisions cached for a rephrased
+        user message may be reused (off by default; see the setting below)
+    SEMANTIC_CACHE_THRESHOLD (float): Minimum similarity for reusing a decision
+        cached for a rephrased user message
+    DISK_CACHE_ENABLED (bool): Whether decisions are also persisted to disk.
+        Off by default; enable only for single-user replay or CI runs
+    DISK_CACHE_DIR (str): Directory holding the persistent decision cache
+    DISK_CACHE_TTL_SECONDS (int): Time-to-live in seconds for persisted decisions
+    CLARIFIER_CONCURRENCY (int): Maximum async clarifier calls in flight at once,
+        across all callers on an event loop, including concurrent batch runs
+    BATCH_COMPLETION_WINDOW (str): Completion window for Batch API jobs
+    BATCH_POLL_INTERVAL_SECONDS (int): Seconds between Batch API status checks
+    BATCH_MAX_WAIT_SECONDS (int): Seconds to wait for a Batch API job to finish
+    SYSTEM_PROMPT (str): System prompt template defining the clarifier role,
+        built lazily on first access
     TOOL_DEFINITIONS (list): Tool definitions for clarifier tool calling
+    TOOL_DEFINITIONS_JSON (bytes): Canonical serialization of TOOL_DEFINITIONS,
+        built once for request fingerprinting
 """
 
 import logging
+from functools import lru_cache
+
+import orjson
 
 from ...global_prompts.project_statement import get_project_statement
 from ...global_prompts.database_statement import get_database_statement
 from ...global_prompts.fiscal_calendar import get_fiscal_statement
 from ...global_prompts.restrictions_statement import get_restrictions_statement
+from ...global_prompts.prompt_utils import build_costar_prompt
+
+__all__ = [
+    "MODEL_CAPABILITY",
+    "MAX_TOKENS",
+    "TEMPERATURE",
+    "FAST_PATH_ENABLED",
+    "DB_ALIASES",
+    "PROMPT_VARIANT_CACHE_SIZE",
+    "CACHE_MAX_ENTRIES",
+    "CACHE_TTL_SECONDS",
+    "SEMANTIC_CACHE_ENABLED",
+    "SEMANTIC_CACHE_THRESHOLD",
+    "DISK_CACHE_ENABLED",
+    "DISK_CACHE_DIR",
+    "DISK_CACHE_TTL_SECONDS",
+    "CLARIFIER_CONCURRENCY",
+    "BATCH_COMPLETION_WINDOW",
+    "BATCH_POLL_INTERVAL_SECONDS",
+    "BATCH_MAX_WAIT_SECONDS",
+    "SYSTEM_PROMPT",
+    "TOOL_DEFINITIONS",
+    "TOOL_DEFINITIONS_JSON",
+    "construct_system_prompt",
+    "construct_dynamic_context",
+]
 
 # Get module logger (no configuration here - using centralized config)
 logger = logging.getLogger(__name__)
@@ -33,9 +86,65 @@ logger = logging.getLogger(__name__)
 MODEL_CAPABILITY = "large"  # Changed from "small" to potentially improve handling of complex instructions
 
 # Model settings
-MAX_TOKENS = 4096
+MAX_TOKENS = 512  # Numbered questions or one research statement fit well within this
 TEMPERATURE = 0.0
 
+# Answer obvious requests with local rules instead of an LLM call
+FAST_PATH_ENABLED = True
+
+# Phrases that name a specific database in a user message, mapped to its id.
+# When the latest message names databases, only their descriptions are sent.
+# Aliases must be unambiguous: everyday words such as "memo", "wiki" or
+# "cheat sheet" also describe what the user wants written, so only phrases
+# that clearly refer to the database itself are listed.
+DB_ALIASES = {
+    "policy manual": "internal_capm",
+    "policy manuals": "internal_capm",
+    "apg cheat sheet": "internal_cheatsheet",
+    "apg cheat sheets": "internal_cheatsheet",
+    "apg infographic": "internal_cheatsheet",
+    "apg infographics": "internal_cheatsheet",
+    "apg wiki": "internal_wiki",
+    "internal memos": "internal_memos",
+    "internal accounting memos": "internal_memos",
+    "project approval request": "internal_par",
+    "icfr policy": "internal_icfr",
+    "ey guidance": "external_ey",
+    "ey ifrs guidance": "external_ey",
+    "kpmg": "external_kpmg",
+    "pwc": "external_pwc",
+    "iasb guidance": "external_iasb",
+    "iasb standards": "external_iasb",
+}
+
+# Maximum number of system prompt variants (one per database selection) kept
+PROMPT_VARIANT_CACHE_SIZE = 32
+
+# Response cache settings (only used while TEMPERATURE is 0.0)
+CACHE_MAX_ENTRIES = 256
+CACHE_TTL_SECONDS = 3600
+# Near-duplicate reuse is opt-in: lexical similarity can still pair requests
+# whose wording differs in ways that matter to the research statement
+SEMANTIC_CACHE_ENABLED = False
+SEMANTIC_CACHE_THRESHOLD = 0.97
+# The disk cache stores research statements derived from user messages in a
+# file shared by every user of the host, so it is opt-in. Entries are keyed on
+# the full request, including the daily fiscal context, so they only match
+# within the same day; enable it for replay, CI or pipeline reruns.
+DISK_CACHE_ENABLED = False
+DISK_CACHE_DIR = "~/.cache/iris/clarifier"
+DISK_CACHE_TTL_SECONDS = 24 * 3600  # Entries stop matching once the fiscal date changes
+
+# Maximum number of async clarifier calls in flight at once. This also governs
+# concurrent batch clarification, which goes through aclarify_research_needs.
+CLARIFIER_CONCURRENCY = 16
+
+# Batch API settings (offline evaluation and backfill workloads)
+BATCH_COMPLETION_WINDOW = "24h"
+BATCH_POLL_INTERVAL_SECONDS = 30
+# Slightly longer than the completion window, after which the job expires
+BATCH_MAX_WAIT_SECONDS = 25 * 3600
+
 # Define the clarifier agent role
 CLARIFIER_ROLE = "an expert clarifier agent in the IRIS workflow"
 
@@ -71,129 +180,73 @@ CLARIFIER_TASK = """<TASK>
 You determine if sufficient context exists to proceed with
 database research or if the user must provide additional information first.
 
+<OVERRIDE_RULE>
+If the user's message contains phrases like "no more clarification", "just search", "no clarification", "skip clarification", or "search without clarification", you MUST choose `create_research_statement` immediately, however little context is available. This overrides every other rule below.
+</OVERRIDE_RULE>
+
 <ANALYSIS_INSTRUCTIONS>
-Carefully evaluate:
+Evaluate:
 1. The entire conversation history, **paying close attention to the last assistant message for potential follow-up context**.
 2. The user's latest question/request.
-3. The specific databases available and their capabilities.
-4. What information would be necessary for effective database research.
-5. **User Intent:** Determine if the user wants a quick list of relevant items ('metadata' scope) or a detailed analysis/answer based on content ('research' scope). Keywords like "find documents", "list items", "catalog search" suggest 'metadata'. Keywords like "analyze", "summarize", "explain", "what does X say about Y" suggest 'research'.
-6. **Follow-up Context:** Examine the **content** of the last assistant message. If it presented a list of items (likely from a previous 'metadata' search, formatted like `* **Document Name** (ID: `doc_id`) - Description`), and the user's current request refers to analyzing one of those specific items (e.g., "analyze Document Name", "tell me more about `doc_id`"), this is a follow-up research request. **Carefully extract the specific Document Name and/or ID mentioned by the user.**
+3. The databases available (as listed in CONTEXT) and their capabilities.
+4. **User Intent:** Does the user want a list of relevant items ('metadata' scope) or a detailed analysis/answer based on content ('research' scope)? "find documents", "list items", "catalog search" suggest 'metadata'; "analyze", "summarize", "explain", "what does X say about Y" suggest 'research'.
+5. **Follow-up Context:** If the last assistant message presented a list of items (formatted like `* **Document Name** (ID: `doc_id`) - Description`) and the user now asks to analyze one of them (e.g., "analyze Document Name", "tell me more about `doc_id`"), this is a follow-up research request. **Extract the specific Document Name and/or ID mentioned by the user.**
 </ANALYSIS_INSTRUCTIONS>
 
 <DATABASE_AWARE_ASSESSMENT>
-When determining necessary context, consider:
-- Which databases (as listed in CONTEXT) would be most relevant to the user's query.
-- What specific information (keywords, topics, standards) would help formulate effective queries for those relevant databases.
-- Only request information that is truly critical for targeting the relevant databases effectively.
-- Do not ask for information if it's not relevant to the capabilities of the available databases.
-- **Crucially:** While you assess database relevance internally, only mention specific databases in the final research statement *if the user explicitly requested them*.
-- Analyze whether the query already contains sufficient context to proceed with research based on the available databases.
-- **Remember the general system preference for internal databases** (as detailed in the CONTEXT section) when assessing relevance. This internal assessment helps guide the Planner later, even if not explicitly stated in your output.
+- Assess which databases would be most relevant, respecting the system preference for internal databases described in CONTEXT; this guides the Planner later.
+- Only request information that is critical for targeting the relevant databases and within their capabilities.
+- Only mention specific databases in the research statement *if the user explicitly requested them*.
 </DATABASE_AWARE_ASSESSMENT>
 
-<DECISION_CRITERIA>
-<PRIORITY_OVERRIDE_RULE>
-**BEFORE ANYTHING ELSE:** If the user's message contains phrases like "no more clarification", "just search", "no clarification", "skip clarification", or "search without clarification", you MUST choose CREATE_RESEARCH_STATEMENT path immediately, without any further analysis. This overrides all other rules and criteria.
-</PRIORITY_OVERRIDE_RULE>
-
-Otherwise, you must choose ONE of two paths:
-
-<REQUEST_ESSENTIAL_CONTEXT_PATH>
-When critical information is missing for effective 'research' scope queries:
-- If the accounting standard (e.g., IFRS, US GAAP) is unclear AND critical for distinguishing the research path, what standard applies? (Note: Remind yourself that the default is IFRS if unspecified, so only ask if ambiguity significantly hinders research direction).
-- Time period or fiscal year of interest (only if clearly relevant to the query and missing).
-- Specific transaction type or accounting event (only if clearly relevant to the query and missing).
-- Industry-specific considerations (only if clearly relevant to the query and missing).
-- Other truly essential information needed for targeted research.
-NOTE: Ensure questions directly relate to resolving critical ambiguity for database targeting based on the query and available DBs. Do not ask generic or forced questions. Only request 1-2 most critical pieces of information, prioritizing what would most improve search quality. Avoid asking about the standard unless absolutely necessary.
-</REQUEST_ESSENTIAL_CONTEXT_PATH>
-
-<CREATE_RESEARCH_STATEMENT_PATH>
-When sufficient information exists:
-- Formulate a clear, specific, and concise research statement summarizing the core research need, designed to maximize factual retrieval by the next agent.
-- **Crucially, include and emphasize:**
-  - **Key Accounting Context:** Explicitly state any specific accounting types (e.g., 'financial assets', 'liabilities', 'equity'), standards (e.g., 'IFRS 15', 'US GAAP ASC 606'), or specific topics (e.g., 'revenue recognition', 'lease accounting') mentioned by the user or clearly implied.
-  - **Specific Type Scoping:** If the user specifies a type like 'financial asset' or 'liability', the research statement MUST explicitly limit the scope to that type (e.g., '...focusing specifically on financial assets ONLY', or '...regarding liabilities'). Prioritize including these terms prominently if present.
-  - **IFRS Default:** If no accounting standard (e.g., IFRS, US GAAP) is specified by the user or clearly implied by context, assume the research should focus on **IFRS** and state this assumption clearly (e.g., "Research focusing on IFRS regarding...").
-  - Other essential context identified (e.g., time periods, industry), but only if relevant and provided/clearly implied.
-  - **Database Focus (User-Specified Only):** ONLY explicitly mention databases if the user specifically requested them (e.g., "User requested search focus on IASB guidance"). Do not infer or suggest databases otherwise.
-  - **If this is a continuation:** Briefly summarize previous findings/gaps and list any remaining planned queries from the prior step to guide the Planner.
-- Structure the statement to clearly guide the Planner's query development, ensuring key accounting terms and scope limitations (like specific asset/liability types or IFRS default) are prominent.
-- Formulate the statement to be precise and information-rich, enabling a subsequent agent to perform a deep-dive search and retrieve the maximum relevant facts and detailed guidance.
-- The statement must be purely factual and focused on the research task. **ABSOLUTELY NO COMMENTARY:** Do not include any commentary on the user's query formulation, the information provided or missing, your own reasoning process, or any opinions. This statement is the *only* context the Planner receives.
-- **For Follow-up Research:** If identified as a follow-up based on the previous assistant message's list, create a highly specific research statement targeting the requested item(s) identified in step 6 (e.g., "Analyze 'Document Name' [ID: `doc_id`] based on the previous metadata search results, focusing on IFRS [unless another standard was specified]."). Include both name and ID if possible.
-</CREATE_RESEARCH_STATEMENT_PATH>
-</DECISION_CRITERIA>
-
 <SCOPE_DETERMINATION>
-Based on your analysis (user intent, follow-up context), determine the `scope`:
 - **'metadata'**: User wants a list/catalog of relevant items.
 - **'research'**: User wants content analysis, synthesis, or answers, OR this is a follow-up request to analyze specific items from a previous metadata search.
 </SCOPE_DETERMINATION>
 
 <CONTEXT_SUFFICIENCY_CRITERIA>
-Sufficient context exists when the query contains enough information to formulate effective database queries *for the determined scope*.
-
-<METADATA_SCOPE_GUIDANCE>
-**IMPORTANT FOR SCOPE 'metadata':** If the determined scope is 'metadata' (e.g., user asks to list files, find documents), context is almost always sufficient. Do NOT request accounting-specific context (like standards, fiscal year, transaction type) for these requests. Proceed directly to `create_research_statement` unless the request is completely unintelligible.
-</METADATA_SCOPE_GUIDANCE>
-
-<USER_STATEMENT_GUIDANCE>
-**IMPORTANT FOR USER STATEMENTS:** The following user instructions MUST be respected:
-
-1. If the user explicitly states they want to skip clarification (e.g., "no more clarification", "just search", "no clarification", "skip clarification", "search without clarification"), IMMEDIATELY proceed to `create_research_statement` without asking any questions, regardless of how little context is available. This is a hard requirement.
-
-2. If the user explicitly states they cannot provide more clarity (e.g., "I can't provide more detail", "just give me a general idea") AND the request is relatively simple (especially for 'metadata' scope), RESPECT THIS and proceed to `create_research_statement` with the information available.
-
-In these cases, do not force clarification questions under any circumstances.
-</USER_STATEMENT_GUIDANCE>
-
-The following elements contribute to context sufficiency (primarily for **scope 'research'**):
-
 <ESSENTIAL_ELEMENTS>
 At least ONE required for 'research' scope:
-- Specific accounting standard mentioned (e.g., "IFRS 15", "IAS 38", "US GAAP ASC 842")
-- Specific accounting topic clearly identified (e.g., "revenue recognition", "lease accounting", "impairment")
-- **Specific accounting type clearly identified (e.g., "asset", "liability", "equity", "financial instrument")**
-- Specific policy area referenced (e.g., "hedge accounting policy", "impairment testing")
-- Database preference indicated (e.g., "check IASB guidance", "look in the policy manual")
+- Specific accounting standard (e.g., "IFRS 15", "IAS 38", "US GAAP ASC 842")
+- Specific accounting topic (e.g., "revenue recognition", "lease accounting", "impairment")
+- **Specific accounting type (e.g., "asset", "liability", "equity", "financial instrument")**
+- Specific policy area (e.g., "hedge accounting policy", "impairment testing")
+- Database preference (e.g., "check IASB guidance", "look in the policy manual")
+Supporting (helpful, not required): time period or fiscal year, industry, transaction type, scenario details.
 </ESSENTIAL_ELEMENTS>
 
-<SUPPORTING_ELEMENTS>
-Helpful but not required:
-- Time period or fiscal year
-- Industry context
-- Transaction type
-- Specific scenario details
-</SUPPORTING_ELEMENTS>
-
 <PROCEED_WITH_RESEARCH>
-Proceed with Research (`create_research_statement`) When:
-- **Scope is 'metadata'**: Almost always proceed, unless the query is unintelligible.
-- **Scope is 'research'**:
-    - ANY Essential Element is present.
-    - The query uses professional accounting terminology and is specific enough.
-    - Previous conversation provides sufficient context.
-    - The user explicitly states they cannot provide more clarity for a reasonably understandable query.
+Choose `create_research_statement` when:
+- Scope is 'metadata': always, unless the request is unintelligible (e.g., "show me stuff"). Never ask about standards, fiscal year or transaction type for 'metadata' requests.
+- Scope is 'research' and ANY Essential Element is present, the query uses specific professional accounting terminology, or the previous conversation provides sufficient context.
+- The user states they cannot provide more clarity (e.g., "I can't provide more detail", "just give me a general idea") and the request is reasonably understandable.
 - **When in doubt, proceed with research** rather than asking for more context.
 </PROCEED_WITH_RESEARCH>
 
 <REQUEST_CONTEXT>
-Request Context Only When (`request_essential_context`):
-- **Scope is 'research'** AND:
-    - NO Essential Elements are present AND the query is too vague for effective research.
-    - Critical ambiguity exists that would lead to searching the wrong databases or standards.
-- **NEVER request context if scope is 'metadata'** unless the core request itself is unclear (e.g., "show me stuff").
-- **AVOID requesting context if the user explicitly states they cannot provide more clarity**, unless the query is completely unusable even with assumptions.
+Choose `request_essential_context` only when scope is 'research' AND either no Essential Elements are present and the query is too vague for effective research, or critical ambiguity would lead to searching the wrong databases or standards.
 </REQUEST_CONTEXT>
-
-<IMPORTANT_GUIDANCE>
-- **PRIORITIZE proceeding to `create_research_statement`**, especially for 'metadata' scope or when the user resists clarification.
-- Only request context for 'research' scope when absolutely necessary to avoid completely ineffective or incorrect research.
-</IMPORTANT_GUIDANCE>
 </CONTEXT_SUFFICIENCY_CRITERIA>
 
+<REQUEST_ESSENTIAL_CONTEXT_PATH>
+Ask for only the 1-2 most critical missing pieces, e.g.:
+- The accounting standard, only if ambiguity significantly hinders research direction (the default is IFRS).
+- Time period, transaction type, or industry considerations, only if clearly relevant and missing.
+Questions must resolve critical ambiguity for database targeting; do not ask generic or forced questions.
+</REQUEST_ESSENTIAL_CONTEXT_PATH>
+
+<CREATE_RESEARCH_STATEMENT_PATH>
+Formulate a clear, specific, information-rich research statement that lets the next agent retrieve the maximum relevant facts and guidance. Include and emphasize:
+- **Key Accounting Context:** Accounting types (e.g., 'financial assets', 'liabilities', 'equity'), standards (e.g., 'IFRS 15', 'US GAAP ASC 606') and topics (e.g., 'revenue recognition', 'lease accounting') mentioned or clearly implied.
+- **Specific Type Scoping:** If the user specifies a type like 'financial asset' or 'liability', the statement MUST explicitly limit the scope to it (e.g., '...focusing specifically on financial assets ONLY').
+- **IFRS Default:** If no standard is specified or clearly implied, focus on **IFRS** and state this assumption (e.g., "Research focusing on IFRS regarding...").
+- Other essential context (time periods, industry) only if provided or clearly implied.
+- **Database Focus:** ONLY mention databases the user specifically requested (e.g., "User requested search focus on IASB guidance").
+- **Continuations:** Briefly summarize previous findings/gaps and list remaining planned queries from the prior step.
+- **Follow-ups:** Target the requested item(s) identified in step 5, including both name and ID if possible (e.g., "Analyze 'Document Name' [ID: `doc_id`] based on the previous metadata search results, focusing on IFRS [unless another standard was specified].").
+The statement is the *only* context the Planner receives and must be purely factual. **NO COMMENTARY** on the user's query, the information provided or missing, your reasoning, or opinions.
+</CREATE_RESEARCH_STATEMENT_PATH>
+
 <CLARIFICATION_EXAMPLES>
 <SUFFICIENT_CONTEXT_EXAMPLES>
 1. "How does IFRS 15 handle contract modifications?"
@@ -250,14 +303,7 @@ Request Context Only When (`request_essential_context`):
 </CLARIFICATION_EXAMPLES>
 
 <CONTINUATION_DETECTION>
-Also identify if the user is requesting continuation of previous research by:
-- Asking to "continue," "proceed," or "go ahead" after your questions were
-  answered
-- Providing the requested essential context from a previous exchange
-- Otherwise indicating they want to proceed with research
-**IMPORTANT:** If detected as a continuation, ensure the research statement
-reflects this and includes necessary context about prior steps
-(see CREATE_RESEARCH_STATEMENT criteria).
+If your previous reply asked for essential context and the user now provides it, or asks to "continue", "proceed" or "go ahead", treat the request as a continuation and write the statement as described under Continuations.
 </CONTINUATION_DETECTION>
 
 <OUTPUT_REQUIREMENTS>
@@ -269,82 +315,70 @@ reflects this and includes necessary context about prior steps
 - If creating a research statement, make it comprehensive and database-aware
 </OUTPUT_REQUIREMENTS>
 
-<WORKFLOW_SUMMARY>
-- You are the CLARIFIER, the first step in the research path (after Router).
-- Input: Conversation history where Router decided research is needed.
-- Task: Assess context sufficiency. Either get missing context via questions
-  OR create a research statement for the Planner.
-- Impact: Your decision affects research quality and efficiency.
-</WORKFLOW_SUMMARY>
-
-<IO_SPECIFICATIONS>
-- Input: Conversation history.
-- Validation: Understand need? Sufficient context? Missing info?
-- Output: `make_clarifier_decision` tool call (`action`:
-  "request_essential_context" or "create_research_statement", `output`:
-  questions or statement, `is_continuation`: boolean).
-- Validation: Questions clear/numbered? Statement comprehensive/DB-aware?
-  Decision matches criteria? Continuation flag correct?
-</IO_SPECIFICATIONS>
-
 <ERROR_HANDLING>
-- MOST IMPORTANT: If user includes any phrases like "no more clarification", "just search", "no clarification", etc., ALWAYS CREATE_RESEARCH_STATEMENT regardless of all other factors. This rule overrides all other rules.
-- General: Handle unexpected input, ambiguity (choose likely, state assumption), missing info (assume reasonably, state assumption), limitations (acknowledge). Use confidence signaling.  
-- Clarifier Specific: Unclear need -> clarify topic. Ambiguous interpretation -> ask for confirmation. Too broad -> ask for specific aspects. Ambiguous continuation -> assume yes if context just provided.
-- When in doubt about whether to clarify, prefer to proceed with research rather than asking questions.
+- Ambiguity or missing information: choose the likely interpretation and state the assumption in the statement.
+- Too broad for 'research' scope: ask for the specific aspects of interest.
+- Ambiguous continuation: assume it is one if the user has just provided the requested context.
+- Override phrases always win: see OVERRIDE_RULE.
 </ERROR_HANDLING>
 </TASK>
 
 <RESPONSE_FORMAT>
 Your response must be a tool call to make_clarifier_decision with:
 - action: "request_essential_context" OR "create_research_statement"
-- output: Clear, specific questions in a numbered list OR a comprehensive research statement
+- output: Clear, specific questions as a numbered list with each question on a new line (e.g., "1. First question\n2. Second question") OR the research statement
 - scope: "metadata" OR "research" (required if action is "create_research_statement")
-- is_continuation: boolean indicating if this is continuing previous research
 
 No additional text or explanation should be included.
 </RESPONSE_FORMAT>
 """
 
 
-# Construct the complete system prompt by combining the necessary statements
-def construct_system_prompt():
+# Construct the complete system prompt by combining the necessary statements.
+# The prompt holds only content that is identical on every call so providers can
+# serve it from their prompt cache; date-dependent context is sent separately.
+# Passing database_ids restricts the database descriptions to the databases the
+# user named; each variant is still static and cached on its own.
+@lru_cache(maxsize=PROMPT_VARIANT_CACHE_SIZE)
+def construct_system_prompt(database_ids=None):
     # Get all the required statements
-    project_statement = get_project_statement()
-    fiscal_statement = get_fiscal_statement()
-    database_statement = get_database_statement()
+    project_statement = get_project_statement(include_timestamp=False)
+    database_statement = get_database_statement(database_ids)
     restrictions_statement = get_restrictions_statement()
 
     # Combine into a formatted system prompt using CO-STAR framework
-    prompt_parts = [
-        "<CONTEXT>",
-        project_statement,
-        fiscal_statement,
-        database_statement,
-        restrictions_statement,
-        "</CONTEXT>",
-        "<OBJECTIVE>",
-        CLARIFIER_OBJECTIVE,
-        "</OBJECTIVE>",
-        "<STYLE>",
-        CLARIFIER_STYLE,
-        "</STYLE>",
-        "<TONE>",
-        CLARIFIER_TONE,
-        "</TONE>",
-        "<AUDIENCE>",
-        CLARIFIER_AUDIENCE,
-        "</AUDIENCE>",
-        f"You are {CLARIFIER_ROLE}.",
-        CLARIFIER_TASK,
-    ]
-
-    # Join with double newlines for readability
-    return "\n\n".join(prompt_parts)
-
-
-# Generate the complete system prompt
-SYSTEM_PROMPT = construct_system_prompt()
+    return build_costar_prompt(
+        context_parts=[
+            project_statement,
+            database_statement,
+            restrictions_statement,
+        ],
+        objective=CLARIFIER_OBJECTIVE,
+        style=CLARIFIER_STYLE,
+        tone=CLARIFIER_TONE,
+        audience=CLARIFIER_AUDIENCE,
+        role=CLARIFIER_ROLE,
+        task=CLARIFIER_TASK,
+    )
+
+
+def construct_dynamic_context():
+    """
+    Build the per-request context that follows the static system prompt.
+
+    Returns:
+        str: Current fiscal context statement
+    """
+    return get_fiscal_statement()
+
+
+def __getattr__(name):
+    # SYSTEM_PROMPT is built on first access rather than at import, so importing
+    # the package does not pay for prompt assembly until the clarifier is used
+    if name == "SYSTEM_PROMPT":
+        return construct_system_prompt()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Tool definition for clarifier decisions
 TOOL_DEFINITIONS = [
@@ -379,13 +413,6 @@ TOOL_DEFINITIONS = [
                         "description": "The determined scope of the user's request ('metadata' for catalog lookup, 'research' for content analysis). Required if action is 'create_research_statement'.",
                         "enum": ["metadata", "research"],
                     },
-                    "is_continuation": {
-                        "type": "boolean",
-                        "description": (
-                            "Whether the user is requesting continuation of "
-                            "previous research."
-                        ),
-                    },
                 },
                 "required": [
                     "action",
@@ -396,4 +423,8 @@ TOOL_DEFINITIONS = [
     }
 ]
 
+# The tool schema never changes at runtime, so serialize it once rather than on
+# every cache key computation. Treat TOOL_DEFINITIONS as read-only.
+TOOL_DEFINITIONS_JSON = orjson.dumps(TOOL_DEFINITIONS, option=orjson.OPT_SORT_KEYS)
+
 logger.debug("Clarifier agent settings initialized")
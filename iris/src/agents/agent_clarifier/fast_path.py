@@ -0,0 +1,224 @@
+# python/iris/src/agents/agent_clarifier/fast_path.py
+"""
+Clarifier Fast Path
+
+This module answers clarifier requests whose outcome is obvious without an LLM
+call: a fresh question naming a specific accounting standard or topic has
+sufficient context, and a very short question that only points at "this" or
+"that" does not. Requests that ask to skip clarification, and anything else,
+return None and go to the model. Fast-path research statements follow the
+form the clarifier prompt asks of the model, including the IFRS default. Whether a request continues earlier research
+is likewise detected here rather than asked of the model.
+
+Functions:
+    fast_path_decision: Rule-based clarifier decision for unambiguous requests
+    detect_continuation: Whether the latest message continues earlier research
+
+Dependencies:
+    - logging
+    - re
+"""
+
+import logging
+import re
+from typing import Any, Dict, List, Optional
+
+# Get module logger (no configuration here - using centralized config)
+logger = logging.getLogger(__name__)
+
+# Specific standards that make a research request sufficient on their own
+_STANDARD_PATTERN = re.compile(
+    r"\b(?:IFRS|IAS)\s?\d+\b|\bUS\s?GAAP(?:\s+ASC\s?\d+)?\b|\bASC\s?\d+\b",
+    re.IGNORECASE,
+)
+
+# Specific topics that make a research request sufficient (IFRS assumed)
+_TOPIC_PATTERN = re.compile(
+    r"\b(?:hedge accounting|revenue recognition|lease accounting|impairment)\b",
+    re.IGNORECASE,
+)
+
+# Kinds of document a catalog-style request asks to have listed
+_CATALOG_DOCUMENTS = r"(?:documents?|files?|memos?|articles?|papers?|publications?)"
+
+# Catalog-style requests, answered with 'metadata' scope: a listing verb
+# followed by the items wanted, or a question asking which documents exist.
+# Broader nouns such as "items" or "sources" only count after a listing verb,
+# since questions like "what items of PP&E..." ask about content.
+_METADATA_PATTERN = re.compile(
+    r"\b(?:list|find|show|catalog(?:ue)?|search for|look(?:ing)? for|locate"
+    r"|identify|pull up)\b.*\b(?:"
+    + _CATALOG_DOCUMENTS
+    + r"|items?|entries|sources?|resources?|materials?)\b"
+    r"|\b(?:which|what|any|are there)\s+(?:\w+\s+)?" + _CATALOG_DOCUMENTS + r"\b",
+    re.IGNORECASE,
+)
+
+# Phrasing that refers to something the user has not described
+_VAGUE_REFERENCE_PATTERN = re.compile(r"\b(?:this|that|it)\b", re.IGNORECASE)
+
+# Instructions to skip clarification, or statements that no more detail can be
+# given. The prompt's override rules apply to these, so they are never answered
+# with canned questions.
+_OVERRIDE_PATTERN = re.compile(
+    r"\b(?:no (?:more )?clarification|skip(?:ping)? (?:the )?clarification"
+    r"|without clarification|just search"
+    r"|can(?:not|'t) provide more|just give me a general idea)\b",
+    re.IGNORECASE,
+)
+
+# A line of a numbered clarifier question list, e.g. "1. Which standard applies?"
+_NUMBERED_LINE_PATTERN = re.compile(r"^\s*\d+\.\s")
+
+# Word tokens used to measure request length
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+# Short vague requests at or above this many words still go to the model
+MAX_VAGUE_REQUEST_TOKENS = 8
+
+# Stated in the research statement when no standard is named, as the clarifier
+# prompt requires
+_IFRS_ASSUMPTION = "No accounting standard was specified, so IFRS is assumed."
+
+# Canned questions for requests that name neither a topic nor a standard
+_ESSENTIAL_CONTEXT_QUESTIONS = (
+    "1. Which accounting topic or standard (e.g., IFRS 15, IAS 38) is this about?\n"
+    "2. What transaction or scenario does this relate to?"
+)
+
+
+def _research_statement(
+    request: str, standards: List[str], topics: List[str], scope: str
+) -> str:
+    """
+    Build a research statement in the form the clarifier prompt asks for.
+
+    The statement leads with the standards (or the IFRS default) and topics
+    found in the request, states the IFRS assumption when no standard was
+    named, and keeps the request itself as the question to answer, since the
+    fast path cannot paraphrase it.
+
+    Args:
+        request (str): The user's request, stripped of surrounding whitespace
+        standards (list): Standards named in the request, in order of mention
+        topics (list): Accounting topics named in the request, lowercased
+        scope (str): 'research' or 'metadata'
+
+    Returns:
+        str: Research statement for the planner
+    """
+    focus = " and ".join(standards) if standards else "IFRS"
+    if topics:
+        focus += f" regarding {' and '.join(topics)}"
+    question = request.rstrip("?.! ")
+
+    if scope == "metadata":
+        statement = f"Identify documents related to {focus}, matching: {question}."
+    else:
+        statement = f"Research focusing on {focus}, answering: {question}."
+    if not standards:
+        statement += f" {_IFRS_ASSUMPTION}"
+    return statement
+
+
+def fast_path_decision(conversation: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Decide obvious clarifier requests locally, without an LLM call.
+
+    Only first requests are considered: once the assistant has replied, the
+    request may be a follow-up or continuation that needs the model's reading
+    of the conversation.
+
+    Args:
+        conversation (dict): Conversation with 'messages' key
+
+    Returns:
+        dict or None: Clarifier decision in the same shape as
+            clarify_research_needs, or None if the model should decide
+    """
+    messages = (conversation or {}).get("messages") or []
+    if len(messages) != 1 or messages[0].get("role") != "user":
+        return None
+
+    text = messages[0].get("content")
+    if not isinstance(text, str) or not text.strip():
+        return None
+    text = text.strip()
+
+    # An explicit request to skip clarification must reach the model, whose
+    # prompt requires it to proceed with research
+    if _OVERRIDE_PATTERN.search(text):
+        return None
+
+    # Every named standard or topic goes into the statement, in order of mention
+    standards = list(
+        dict.fromkeys(match.upper() for match in _STANDARD_PATTERN.findall(text))
+    )
+    topics = list(dict.fromkeys(t.lower() for t in _TOPIC_PATTERN.findall(text)))
+
+    if standards or topics:
+        scope = "metadata" if _METADATA_PATTERN.search(text) else "research"
+        logger.info(
+            f"Clarifier fast path: sufficient context "
+            f"({', '.join(standards + topics)}; scope: {scope})"
+        )
+        return {
+            "action": "create_research_statement",
+            "output": _research_statement(text, standards, topics, scope),
+            "scope": scope,
+            "is_continuation": False,
+        }
+
+    if (
+        len(_TOKEN_PATTERN.findall(text)) < MAX_VAGUE_REQUEST_TOKENS
+        and _VAGUE_REFERENCE_PATTERN.search(text)
+        and not _METADATA_PATTERN.search(text)
+    ):
+        logger.info("Clarifier fast path: essential context missing")
+        return {
+            "action": "request_essential_context",
+            "output": _ESSENTIAL_CONTEXT_QUESTIONS,
+            "scope": None,
+            "is_continuation": False,
+        }
+
+    return None
+
+
+def _is_clarifier_question(text: str) -> bool:
+    """Whether an assistant message is a numbered list of clarifier questions."""
+    lines = [line for line in text.splitlines() if line.strip()]
+    return (
+        bool(lines)
+        and "?" in text
+        and all(_NUMBERED_LINE_PATTERN.match(line) for line in lines)
+    )
+
+
+def detect_continuation(messages: List[Dict[str, Any]]) -> bool:
+    """
+    Detect whether the latest user message continues earlier research.
+
+    A request is a continuation only when it follows the clarifier's questions
+    from the previous turn: it either answers them or asks to go ahead. After
+    any other assistant reply, wording such as "proceed" is part of a new
+    question, not a continuation.
+
+    Args:
+        messages (list): Conversation messages, optionally including system messages
+
+    Returns:
+        bool: True if the latest user message continues earlier research
+    """
+    if not messages or messages[-1].get("role") != "user":
+        return False
+
+    previous_reply = next(
+        (
+            message.get("content")
+            for message in reversed(messages[:-1])
+            if message.get("role") == "assistant"
+        ),
+        None,
+    )
+    return isinstance(previous_reply, str) and _is_clarifier_question(previous_reply)
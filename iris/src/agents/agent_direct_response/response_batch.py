@@ -0,0 +1,89 @@
+# python/iris/src/agents/agent_direct_response/response_batch.py
+"""
+Direct Response Batch Module
+
+This module generates direct responses for many independent conversations at
+once, for workloads such as alternate-reply prefetch and evaluation runs. The
+streams are consumed concurrently over the async client, so the requests
+overlap their connection setup and time to first token instead of running
+one after another.
+
+Functions:
+    response_from_conversations_batch: Generate direct responses concurrently
+    response_from_conversations_batch_sync: Synchronous wrapper for scripts
+
+Dependencies:
+    - asyncio
+    - logging
+"""
+
+import asyncio
+import logging
+
+from .response_from_conversation import (
+    DirectResponseError,
+    response_from_conversation_async,
+)
+from .response_settings import BATCH_CONCURRENCY_LIMIT
+
+# Get module logger (no configuration here - using centralized config)
+logger = logging.getLogger(__name__)
+
+
+async def response_from_conversations_batch(
+    conversations, token, concurrency_limit=BATCH_CONCURRENCY_LIMIT
+):
+    """
+    Generate direct responses for many conversations concurrently.
+
+    Args:
+        conversations (list): Conversations, each a dict with a 'messages' key
+        token (str): Authentication token for API access
+        concurrency_limit (int): Maximum number of streams in flight at once
+
+    Returns:
+        list: One entry per conversation, in input order. Each entry is either
+            the complete response text or the DirectResponseError raised for it.
+    """
+    semaphore = asyncio.Semaphore(concurrency_limit)
+
+    async def _respond(conversation):
+        async with semaphore:
+            try:
+                chunks = [
+                    chunk
+                    async for chunk in response_from_conversation_async(
+                        conversation, token
+                    )
+                ]
+            except DirectResponseError as e:
+                return e
+            return "".join(chunks)
+
+    logger.info(
+        f"Generating direct responses for {len(conversations)} conversations "
+        f"(concurrency limit: {concurrency_limit})"
+    )
+    return await asyncio.gather(*(_respond(c) for c in conversations))
+
+
+def response_from_conversations_batch_sync(
+    conversations, token, concurrency_limit=BATCH_CONCURRENCY_LIMIT
+):
+    """
+    Synchronous wrapper around response_from_conversations_batch.
+
+    Intended for scripts and evaluation runs; it starts its own event loop, so
+    callers already running inside one should await the async variant instead.
+
+    Args:
+        conversations (list): Conversations, each a dict with a 'messages' key
+        token (str): Authentication token for API access
+        concurrency_limit (int): Maximum number of streams in flight at once
+
+    Returns:
+        list: Response texts or DirectResponseError instances, in input order
+    """
+    return asyncio.run(
+        response_from_conversations_batch(conversations, token, concurrency_limit)
+    )
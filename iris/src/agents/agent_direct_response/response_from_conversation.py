@@ -7,6 +7,7 @@ without requiring additional database research.
 
 Functions:
     response_from_conversation: Generate a direct response based on conversation context
+    response_from_conversation_async: Async variant for use inside an event loop
 
 Dependencies:
     - json
@@ -15,10 +16,17 @@ Dependencies:
 """
 
 import logging
+from functools import lru_cache
 
 from ...chat_model.model_settings import get_model_config
-from ...llm_connectors.rbc_openai import call_llm
-from .response_settings import MAX_TOKENS, MODEL_CAPABILITY, SYSTEM_PROMPT, TEMPERATURE
+from ...llm_connectors.rbc_openai import acall_llm, cacheable_system_message, call_llm
+from .response_settings import (
+    MAX_TOKENS,
+    MODEL_CAPABILITY,
+    TEMPERATURE,
+    construct_dynamic_context,
+    construct_system_prompt,
+)
 
 # Get module logger (no configuration here - using centralized config)
 logger = logging.getLogger(__name__)
@@ -36,6 +44,46 @@ class DirectResponseError(Exception):
     pass
 
 
+@lru_cache(maxsize=1)
+def _system_message():
+    """
+    Build the static system message once and share it across calls.
+
+    The dict is never mutated: the OpenAI client only reads it, so one instance
+    serves every request.
+    """
+    return cacheable_system_message(construct_system_prompt())
+
+
+def _prepare_messages(conversation):
+    """
+    Prepend the direct response system prompt to the conversation messages.
+
+    The static system prompt comes first so it can be served from the prompt
+    cache, followed by the date-dependent context and the conversation.
+    """
+    dynamic_message = {"role": "system", "content": construct_dynamic_context()}
+    return [
+        _system_message(),
+        dynamic_message,
+        *(conversation or {}).get("messages", ()),
+    ]
+
+
+def _llm_params(messages, token):
+    """Build the call_llm/acall_llm keyword arguments for a direct response."""
+    return dict(
+        oauth_token=token,
+        model=MODEL_NAME,
+        messages=messages,
+        max_tokens=MAX_TOKENS,
+        temperature=TEMPERATURE,
+        stream=True,
+        prompt_token_cost=PROMPT_TOKEN_COST,
+        completion_token_cost=COMPLETION_TOKEN_COST,
+    )
+
+
 def response_from_conversation(conversation, token):
     """
     Generate a direct response based solely on conversation context.
@@ -53,39 +101,56 @@ def response_from_conversation(conversation, token):
         DirectResponseError: If there is an error in generating the response
     """
     try:
-        # Prepare system message with response prompt
-        system_message = {"role": "system", "content": SYSTEM_PROMPT}
-
-        # Prepare messages for the API call
-        messages = [system_message]
-        if conversation and "messages" in conversation:
-            messages.extend(conversation["messages"])
+        messages = _prepare_messages(conversation)
 
         logger.info(f"Generating direct response using model: {MODEL_NAME}")
-        logger.info(
-            "Initiating Direct Response stream API call"
-        )  # Added contextual log
 
         # Make the API call with streaming
-        response_stream = call_llm(
-            oauth_token=token,
-            model=MODEL_NAME,
-            messages=messages,
-            max_tokens=MAX_TOKENS,
-            temperature=TEMPERATURE,
-            stream=True,
-            prompt_token_cost=PROMPT_TOKEN_COST,
-            completion_token_cost=COMPLETION_TOKEN_COST,
+        response_stream = call_llm(**_llm_params(messages, token))
+
+        # Process the streaming response, skipping chunks without content
+        deltas = (chunk.choices[0].delta for chunk in response_stream if chunk.choices)
+        yield from (
+            delta.content for delta in deltas if getattr(delta, "content", None)
         )
 
-        # Process the streaming response
-        for chunk in response_stream:
-            if (
-                chunk.choices
-                and chunk.choices[0].delta
-                and chunk.choices[0].delta.content
-            ):
-                content = chunk.choices[0].delta.content
+        logger.info("Direct response generation complete")
+
+    except Exception as e:
+        logger.error(f"Error generating direct response: {str(e)}")
+        raise DirectResponseError(f"Failed to generate direct response: {str(e)}")
+
+
+async def response_from_conversation_async(conversation, token):
+    """
+    Async variant of response_from_conversation for use inside an event loop.
+
+    The stream is consumed on the async client, so the loop can interleave
+    other requests while waiting for tokens.
+
+    Args:
+        conversation (dict): Conversation with 'messages' key
+        token (str): Authentication token for API access
+
+    Returns:
+        async generator: Stream of response chunks for real-time display
+
+    Raises:
+        DirectResponseError: If there is an error in generating the response
+    """
+    try:
+        messages = _prepare_messages(conversation)
+
+        logger.info(f"Generating async direct response using model: {MODEL_NAME}")
+
+        response_stream = await acall_llm(**_llm_params(messages, token))
+
+        async for chunk in response_stream:
+            choices = chunk.choices
+            if not choices:
+                continue
+            content = getattr(choices[0].delta, "content", None)
+            if content:
                 yield content
 
         logger.info("Direct response generation complete")
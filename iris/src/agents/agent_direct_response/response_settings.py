@@ -15,15 +15,19 @@ Attributes:
     MODEL_CAPABILITY (str): The model capability to use ('small' or 'large')
     MAX_TOKENS (int): Maximum tokens for model response
     TEMPERATURE (float): Randomness parameter (0-1)
+    BATCH_CONCURRENCY_LIMIT (int): Maximum in-flight requests when generating
+        direct responses for many conversations at once
     SYSTEM_PROMPT (str): System prompt template defining the response agent role
 """
 
 import logging
+from functools import lru_cache
 
 from ...global_prompts.project_statement import get_project_statement
 from ...global_prompts.database_statement import get_database_statement
 from ...global_prompts.fiscal_calendar import get_fiscal_statement
 from ...global_prompts.restrictions_statement import get_restrictions_statement
+from ...global_prompts.prompt_utils import build_costar_prompt
 
 # Get module logger (no configuration here - using centralized config)
 logger = logging.getLogger(__name__)
@@ -35,6 +39,9 @@ MODEL_CAPABILITY = "large"
 MAX_TOKENS = 4096
 TEMPERATURE = 0.7
 
+# Batch generation settings
+BATCH_CONCURRENCY_LIMIT = 16  # Direct response streams consumed at once
+
 # Define the direct response agent role and task
 RESPONSE_ROLE = "an expert direct response agent in the IRIS workflow"
 
@@ -187,42 +194,46 @@ Your response should be a well-structured, comprehensive answer that:
 
 
 # Construct the complete system prompt by combining the necessary statements
+@lru_cache(maxsize=1)
 def construct_system_prompt():
-    # Get all the required statements
-    project_statement = get_project_statement()
-    fiscal_statement = get_fiscal_statement()
+    # Only static statements belong here: the prompt is sent as a cacheable
+    # prefix, so anything date-dependent goes in construct_dynamic_context
+    project_statement = get_project_statement(include_timestamp=False)
     database_statement = get_database_statement()
     restrictions_statement = get_restrictions_statement()
 
     # Combine into a formatted system prompt using CO-STAR framework
-    prompt_parts = [
-        "<CONTEXT>",
-        project_statement,
-        fiscal_statement,
-        database_statement,
-        restrictions_statement,
-        "</CONTEXT>",
-        "<OBJECTIVE>",
-        RESPONSE_OBJECTIVE,
-        "</OBJECTIVE>",
-        "<STYLE>",
-        RESPONSE_STYLE,
-        "</STYLE>",
-        "<TONE>",
-        RESPONSE_TONE,
-        "</TONE>",
-        "<AUDIENCE>",
-        RESPONSE_AUDIENCE,
-        "</AUDIENCE>",
-        f"You are {RESPONSE_ROLE}.",
-        RESPONSE_TASK,
-    ]
-
-    # Join with double newlines for readability
-    return "\n\n".join(prompt_parts)
-
-
-# Generate the complete system prompt
-SYSTEM_PROMPT = construct_system_prompt()
+    return build_costar_prompt(
+        context_parts=[
+            project_statement,
+            database_statement,
+            restrictions_statement,
+        ],
+        objective=RESPONSE_OBJECTIVE,
+        style=RESPONSE_STYLE,
+        tone=RESPONSE_TONE,
+        audience=RESPONSE_AUDIENCE,
+        role=RESPONSE_ROLE,
+        task=RESPONSE_TASK,
+    )
+
+
+def construct_dynamic_context():
+    """
+    Build the per-request context that follows the static system prompt.
+
+    Returns:
+        str: Current fiscal context statement
+    """
+    return get_fiscal_statement()
+
+
+def __getattr__(name):
+    # SYSTEM_PROMPT is built on first access rather than at import, so importing
+    # the package does not pay for prompt assembly until a response is generated
+    if name == "SYSTEM_PROMPT":
+        return construct_system_prompt()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 logger.debug("Direct response agent settings initialized")
@@ -8,25 +8,37 @@ and what specific queries to run.
 
 Functions:
     create_query_plan: Creates a plan of database queries based on a research statement
+    prepare_messages: Build the planner request messages for a research statement
+    llm_params: Build the call_llm keyword arguments for a planner request
+    parse_plan: Extract and validate the plan from a tool-call response
 
 Dependencies:
-    - json
     - logging
+    - orjson
     - OpenAI connector for LLM calls
+    - Agent response cache
 """
 
-import json
 import logging
+from functools import lru_cache
+
+import orjson
 
 from ...chat_model.model_settings import get_model_config
-from ...llm_connectors.rbc_openai import call_llm
+from ...llm_connectors.rbc_openai import cacheable_system_message, call_llm
+from ..response_cache import ResponseCache, SemanticResponseCache, make_cache_key
 from .planner_settings import (
     AVAILABLE_DATABASES,
+    CACHE_MAX_ENTRIES,
+    CACHE_TTL_SECONDS,
     MAX_TOKENS,
     MODEL_CAPABILITY,
-    SYSTEM_PROMPT,
+    SEMANTIC_CACHE_ENABLED,
+    SEMANTIC_CACHE_THRESHOLD,
     TEMPERATURE,
     TOOL_DEFINITIONS,
+    construct_system_prompt,
+    construct_dynamic_context,
 )
 
 # Get module logger (no configuration here - using centralized config)
@@ -35,12 +47,47 @@ logger = logging.getLogger(__name__)
 # Extract the new tool name from settings for clarity
 PLANNER_TOOL_NAME = TOOL_DEFINITIONS[0]["function"]["name"]
 
+# Force the model to answer through the database selection tool
+TOOL_CHOICE = {"type": "function", "function": {"name": PLANNER_TOOL_NAME}}
+
+# Tool definitions serialized once for building cache keys
+TOOL_DEFINITIONS_JSON = orjson.dumps(TOOL_DEFINITIONS)
+
 # Get model configuration based on capability
 model_config = get_model_config(MODEL_CAPABILITY)
 MODEL_NAME = model_config["name"]
 PROMPT_TOKEN_COST = model_config["prompt_token_cost"]
 COMPLETION_TOKEN_COST = model_config["completion_token_cost"]
 
+# Exact-match plan cache, only consulted for deterministic (temperature 0) calls.
+# The key covers the full message list, so a new fiscal period or research
+# statement always misses.
+_plan_cache = ResponseCache(
+    max_entries=CACHE_MAX_ENTRIES, default_ttl=CACHE_TTL_SECONDS
+)
+
+# Near-duplicate cache for rewordings of the same research statement (opt-in)
+_semantic_plan_cache = (
+    SemanticResponseCache(
+        threshold=SEMANTIC_CACHE_THRESHOLD,
+        max_entries=CACHE_MAX_ENTRIES,
+        default_ttl=CACHE_TTL_SECONDS,
+    )
+    if SEMANTIC_CACHE_ENABLED
+    else None
+)
+
+
+@lru_cache(maxsize=1)
+def _system_message():
+    """
+    Build the planner system message on first use and share it across calls.
+
+    The dict is never mutated: the OpenAI client only reads it, so one instance
+    serves every request.
+    """
+    return cacheable_system_message(construct_system_prompt())
+
 
 class PlannerError(Exception):
     """Base exception class for planner-related errors."""
@@ -48,6 +95,89 @@ class PlannerError(Exception):
     pass
 
 
+def prepare_messages(research_statement, is_continuation=False):
+    """Build the planner messages for a research statement."""
+    # Prepare the research statement as user message
+    continuation_prefix = "[CONTINUATION REQUEST] " if is_continuation else ""
+    research_message = {
+        "role": "user",
+        "content": f"{continuation_prefix}Research Statement: {research_statement}",
+    }
+
+    # Static system prompt first so it can be served from the prompt cache,
+    # then the date-dependent context. Database information is included in
+    # the system prompt.
+    dynamic_message = {"role": "system", "content": construct_dynamic_context()}
+    return [_system_message(), dynamic_message, research_message]
+
+
+def llm_params(messages, token):
+    """Build the call_llm keyword arguments for a planner request."""
+    return dict(
+        oauth_token=token,
+        model=MODEL_NAME,
+        messages=messages,
+        max_tokens=MAX_TOKENS,
+        temperature=TEMPERATURE,
+        tools=TOOL_DEFINITIONS,
+        tool_choice=TOOL_CHOICE,
+        stream=False,
+        prompt_token_cost=PROMPT_TOKEN_COST,
+        completion_token_cost=COMPLETION_TOKEN_COST,
+    )
+
+
+def parse_plan(response):
+    """
+    Extract and validate the database selection plan from a tool-call response.
+
+    Args:
+        response: Chat completion response containing the tool call
+
+    Returns:
+        dict: Database selection plan with a 'databases' list
+
+    Raises:
+        PlannerError: If the response does not contain a valid plan
+    """
+    # Extract the tool call from the response
+    try:
+        tool_call = response.choices[0].message.tool_calls[0]
+    except (AttributeError, IndexError, TypeError):
+        raise PlannerError("No tool call received in response")
+    if tool_call is None:
+        raise PlannerError("No tool call received in response")
+
+    # Verify that the correct function was called
+    if tool_call.function.name != PLANNER_TOOL_NAME:
+        raise PlannerError(f"Unexpected function call: {tool_call.function.name}")
+
+    # Parse the arguments
+    try:
+        arguments = orjson.loads(tool_call.function.arguments)
+    except orjson.JSONDecodeError:
+        raise PlannerError(
+            f"Invalid JSON in tool arguments: {tool_call.function.arguments}"
+        )
+
+    # Extract selected databases
+    selected_databases = arguments.get("databases", [])
+
+    if not selected_databases:
+        raise PlannerError("Missing or empty 'databases' in tool arguments")
+
+    # Validate selected databases
+    validated_databases = []
+    for i, db_name in enumerate(selected_databases):
+        if not isinstance(db_name, str):
+            raise PlannerError(f"Database entry {i+1} is not a string: {db_name}")
+        if db_name not in AVAILABLE_DATABASES:
+            raise PlannerError(f"Selected database {i+1} is unknown: {db_name}")
+        validated_databases.append(db_name)
+
+    return {"databases": validated_databases}
+
+
 def create_database_selection_plan(research_statement, token, is_continuation=False):
     """
     Create a plan of selected databases based on a research statement.
@@ -67,85 +197,46 @@ def create_database_selection_plan(research_statement, token, is_continuation=Fa
         PlannerError: If there is an error in creating the database selection plan
     """
     try:
-        # Prepare system message with planner prompt
-        system_message = {"role": "system", "content": SYSTEM_PROMPT}
-
-        # Prepare the research statement as user message
-        continuation_prefix = "[CONTINUATION REQUEST] " if is_continuation else ""
-        research_message = {
-            "role": "user",
-            "content": f"{continuation_prefix}Research Statement: {research_statement}",
-        }
-
-        # Prepare messages for the API call
-        messages = [system_message, research_message]
-
-        # Database information is included in the SYSTEM_PROMPT
-
-        logger.info(f"Creating database selection plan using model: {MODEL_NAME}")
-        logger.info(f"Is continuation: {is_continuation}")
-        logger.info("Initiating Planner API call for database selection")
+        messages = prepare_messages(research_statement, is_continuation)
 
-        # Make the API call with tool calling
-        response = call_llm(
-            oauth_token=token,
-            model=MODEL_NAME,
-            messages=messages,
-            max_tokens=MAX_TOKENS,
-            temperature=TEMPERATURE,
-            tools=TOOL_DEFINITIONS,
-            tool_choice={
-                "type": "function",
-                "function": {"name": PLANNER_TOOL_NAME},
-            },  # Use new tool name
-            stream=False,
-            prompt_token_cost=PROMPT_TOKEN_COST,
-            completion_token_cost=COMPLETION_TOKEN_COST,
-        )
-
-        # Extract the tool call from the response
-        if (
-            not response.choices
-            or not response.choices[0].message
-            or not response.choices[0].message.tool_calls
-            or not response.choices[0].message.tool_calls[0]
-        ):
-            raise PlannerError("No tool call received in response")
-
-        tool_call = response.choices[0].message.tool_calls[0]
-
-        # Verify that the correct function was called
-        if tool_call.function.name != PLANNER_TOOL_NAME:
-            raise PlannerError(f"Unexpected function call: {tool_call.function.name}")
-
-        # Parse the arguments
-        try:
-            arguments = json.loads(tool_call.function.arguments)
-        except json.JSONDecodeError:
-            raise PlannerError(
-                f"Invalid JSON in tool arguments: {tool_call.function.arguments}"
+        cache_key = None
+        if TEMPERATURE == 0:
+            cache_key = make_cache_key(
+                MODEL_NAME, messages, TOOL_DEFINITIONS_JSON, TOOL_CHOICE
             )
+            cached_plan = _plan_cache.get(cache_key)
+            if cached_plan is None and _semantic_plan_cache is not None:
+                cached_plan = _semantic_plan_cache.get(MODEL_NAME, messages)
+                if cached_plan is not None:
+                    _plan_cache.set(cache_key, cached_plan)
+            if cached_plan is not None:
+                logger.info(
+                    f"Database selection plan served from cache: {cached_plan['databases']}"
+                )
+                return {"databases": list(cached_plan["databases"])}
 
-        # Extract selected databases
-        selected_databases = arguments.get("databases", [])
-
-        if not selected_databases:
-            raise PlannerError("Missing or empty 'databases' in tool arguments")
+        logger.info(
+            f"Creating database selection plan using model: {MODEL_NAME} "
+            f"(continuation: {is_continuation})"
+        )
 
-        # Validate selected databases
-        validated_databases = []
-        for i, db_name in enumerate(selected_databases):
-            if not isinstance(db_name, str):
-                raise PlannerError(f"Database entry {i+1} is not a string: {db_name}")
-            if db_name not in AVAILABLE_DATABASES:
-                raise PlannerError(f"Selected database {i+1} is unknown: {db_name}")
-            validated_databases.append(db_name)
+        # Make the API call with tool calling
+        response = call_llm(**llm_params(messages, token))
+        validated_databases = parse_plan(response)["databases"]
 
         # Log the database selection plan
         logger.info(
             f"Database selection plan created with {len(validated_databases)} databases: {validated_databases}"
         )
 
+        if cache_key is not None:
+            plan = {"databases": list(validated_databases)}
+            _plan_cache.set(cache_key, plan, ttl=CACHE_TTL_SECONDS)
+            if _semantic_plan_cache is not None:
+                _semantic_plan_cache.set(
+                    MODEL_NAME, messages, plan, ttl=CACHE_TTL_SECONDS
+                )
+
         return {"databases": validated_databases}
 
     except Exception as e:
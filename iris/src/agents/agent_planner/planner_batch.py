@@ -0,0 +1,99 @@
+# python/iris/src/agents/agent_planner/planner_batch.py
+"""
+Planner Batch Module
+
+This module plans many research statements at once for evaluation, replay and
+pre-population workloads. All requests are submitted as a single Batch API
+job, trading latency for the reduced batch pricing, and the results are parsed
+through the same validation as interactive planning.
+
+Functions:
+    submit_planner_batch: Upload research statements as a Batch API job
+    collect_planner_batch: Wait for a Batch API job and parse its plans
+
+Dependencies:
+    - logging
+    - OpenAI batch connector
+"""
+
+import logging
+
+from ...llm_connectors.openai_batch import collect_batch, submit_batch
+from ...llm_connectors.rbc_openai import OpenAIConnectorError
+from .planner import PlannerError, llm_params, parse_plan, prepare_messages
+from .planner_settings import (
+    BATCH_COMPLETION_WINDOW,
+    BATCH_MAX_WAIT_SECONDS,
+    BATCH_POLL_INTERVAL_SECONDS,
+)
+
+# Get module logger (no configuration here - using centralized config)
+logger = logging.getLogger(__name__)
+
+
+def submit_planner_batch(research_statements, token, is_continuation=False):
+    """
+    Upload research statements as a Batch API job.
+
+    Args:
+        research_statements (list): Research statements from the clarifier
+        token (str): Authentication token for API access
+        is_continuation (bool, optional): Whether the statements continue
+            previous research
+
+    Returns:
+        str: ID of the created batch job
+    """
+    return submit_batch(
+        "planner",
+        [
+            llm_params(prepare_messages(statement, is_continuation), token)
+            for statement in research_statements
+        ],
+        token,
+        BATCH_COMPLETION_WINDOW,
+    )
+
+
+def collect_planner_batch(
+    batch_id,
+    token,
+    request_count,
+    poll_interval=BATCH_POLL_INTERVAL_SECONDS,
+    max_wait=BATCH_MAX_WAIT_SECONDS,
+):
+    """
+    Wait for a Batch API job to finish and parse its database selection plans.
+
+    Args:
+        batch_id (str): ID returned by submit_planner_batch
+        token (str): Authentication token for API access
+        request_count (int): Number of research statements submitted in the batch
+        poll_interval (int): Seconds between status checks
+        max_wait (int): Seconds to wait for the job before giving up
+
+    Returns:
+        list: One entry per submitted statement, in input order. Each entry is
+            either the database selection plan dict or a PlannerError.
+
+    Raises:
+        PlannerError: If the batch job ends without producing output or
+            is still running after max_wait seconds
+    """
+    try:
+        completions = collect_batch(
+            "planner", batch_id, token, request_count, poll_interval, max_wait
+        )
+    except OpenAIConnectorError as e:
+        raise PlannerError(str(e)) from e
+
+    results = []
+    for completion in completions:
+        if isinstance(completion, OpenAIConnectorError):
+            results.append(PlannerError(str(completion)))
+            continue
+        try:
+            results.append(parse_plan(completion))
+        except PlannerError as e:
+            results.append(e)
+    return results
@@ -18,9 +18,19 @@ Attributes:
     SYSTEM_PROMPT (str): System prompt template defining the planner role
     TOOL_DEFINITIONS (list): Tool definitions for planner tool calling
     AVAILABLE_DATABASES (dict): Information about available databases
+    CACHE_MAX_ENTRIES (int): Maximum number of plans held in the response cache
+    CACHE_TTL_SECONDS (int): Time-to-live in seconds for cached plans
+    SEMANTIC_CACHE_ENABLED (bool): Whether plans cached for a reworded research
+        statement may be reused (off by default; see the setting below)
+    SEMANTIC_CACHE_THRESHOLD (float): Minimum similarity for reusing a plan
+        cached for a reworded research statement
+    BATCH_COMPLETION_WINDOW (str): Completion window for Batch API jobs
+    BATCH_POLL_INTERVAL_SECONDS (int): Seconds between Batch API status checks
+    BATCH_MAX_WAIT_SECONDS (int): Seconds to wait for a Batch API job to finish
 """
 
 import logging
+from functools import lru_cache
 
 from ...global_prompts.project_statement import get_project_statement
 from ...global_prompts.database_statement import (
@@ -29,6 +39,7 @@ from ...global_prompts.database_statement import (
 )
 from ...global_prompts.fiscal_calendar import get_fiscal_statement
 from ...global_prompts.restrictions_statement import get_restrictions_statement
+from ...global_prompts.prompt_utils import build_costar_prompt
 
 # Get module logger (no configuration here - using centralized config)
 logger = logging.getLogger(__name__)
@@ -40,6 +51,22 @@ MODEL_CAPABILITY = "small"
 MAX_TOKENS = 4096
 TEMPERATURE = 0.0
 
+# Response cache settings (plans are only cached for temperature 0 calls)
+CACHE_MAX_ENTRIES = 256
+CACHE_TTL_SECONDS = 3600
+# Near-duplicate reuse is opt-in: lexical similarity can still pair statements
+# whose wording differs in ways that matter to the database selection. Matches
+# also require identical numbers, standard names and negations, and a prompt
+# change invalidates every entry since the prompt is part of the match context.
+SEMANTIC_CACHE_ENABLED = False
+SEMANTIC_CACHE_THRESHOLD = 0.97
+
+# Batch API settings for offline planning runs
+BATCH_COMPLETION_WINDOW = "24h"
+BATCH_POLL_INTERVAL_SECONDS = 30
+# Slightly longer than the completion window, after which the job expires
+BATCH_MAX_WAIT_SECONDS = 25 * 3600
+
 # Import database configuration from global prompts
 AVAILABLE_DATABASES = get_available_databases()
 
@@ -90,10 +117,6 @@ For each research statement:
 5. **Do NOT formulate individual query texts.** The full research statement will be used as the query for all selected databases. Your task is ONLY to select the appropriate databases based on the above prioritization.
 </ANALYSIS_INSTRUCTIONS>
 
-<QUERY_FORMULATION_GUIDELINES>
-**REMOVED:** You are no longer responsible for formulating query text. Your only task is database selection.
-</QUERY_FORMULATION_GUIDELINES>
-
 <CONTINUATION_HANDLING>
 If this is a continuation of previous research:
 - Analyze the research statement for information about previous results or remaining gaps.
@@ -139,43 +162,47 @@ No additional text or explanation should be included.
 
 
 # Construct the complete system prompt by combining the necessary statements
+@lru_cache(maxsize=1)
 def construct_system_prompt():
-    # Get all the required statements
-    project_statement = get_project_statement()
-    fiscal_statement = get_fiscal_statement()
+    # Only static statements belong here: the prompt is sent as a cacheable
+    # prefix, so anything date-dependent goes in construct_dynamic_context
+    project_statement = get_project_statement(include_timestamp=False)
     database_statement = get_database_statement()
     restrictions_statement = get_restrictions_statement()
 
     # Combine into a formatted system prompt using CO-STAR framework
-    prompt_parts = [
-        "<CONTEXT>",
-        project_statement,
-        fiscal_statement,
-        database_statement,
-        restrictions_statement,
-        "</CONTEXT>",
-        "<OBJECTIVE>",
-        PLANNER_OBJECTIVE,
-        "</OBJECTIVE>",
-        "<STYLE>",
-        PLANNER_STYLE,
-        "</STYLE>",
-        "<TONE>",
-        PLANNER_TONE,
-        "</TONE>",
-        "<AUDIENCE>",
-        PLANNER_AUDIENCE,
-        "</AUDIENCE>",
-        f"You are {PLANNER_ROLE}.",
-        PLANNER_TASK,
-    ]
-
-    # Join with double newlines for readability
-    return "\n\n".join(prompt_parts)
-
-
-# Generate the complete system prompt
-SYSTEM_PROMPT = construct_system_prompt()
+    return build_costar_prompt(
+        context_parts=[
+            project_statement,
+            database_statement,
+            restrictions_statement,
+        ],
+        objective=PLANNER_OBJECTIVE,
+        style=PLANNER_STYLE,
+        tone=PLANNER_TONE,
+        audience=PLANNER_AUDIENCE,
+        role=PLANNER_ROLE,
+        task=PLANNER_TASK,
+    )
+
+
+def construct_dynamic_context():
+    """
+    Build the per-request context that follows the static system prompt.
+
+    Returns:
+        str: Current fiscal context statement
+    """
+    return get_fiscal_statement()
+
+
+def __getattr__(name):
+    # SYSTEM_PROMPT is built on first access rather than at import, so processes
+    # that never reach the planner do not pay for prompt assembly
+    if name == "SYSTEM_PROMPT":
+        return construct_system_prompt()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Tool definition for database selection planning
 TOOL_DEFINITIONS = [
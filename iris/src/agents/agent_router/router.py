@@ -10,22 +10,29 @@ Functions:
     get_routing_decision: Gets routing decision from the model via tool call
 
 Dependencies:
-    - json
     - logging
+    - orjson
     - OpenAI connector for LLM calls
+    - Agent response cache
 """
 
-import json
 import logging
+from functools import lru_cache
+
+import orjson
 
 from ...chat_model.model_settings import get_model_config
-from ...llm_connectors.rbc_openai import call_llm
+from ...llm_connectors.rbc_openai import cacheable_system_message, call_llm
+from ..response_cache import ResponseCache, make_cache_key
 from .router_settings import (
+    CACHE_MAX_ENTRIES,
+    CACHE_TTL_SECONDS,
     MAX_TOKENS,
     MODEL_CAPABILITY,
-    SYSTEM_PROMPT,
     TEMPERATURE,
     TOOL_DEFINITIONS,
+    construct_dynamic_context,
+    construct_system_prompt,
 )
 
 # Get module logger (no configuration here - using centralized config)
@@ -37,6 +44,30 @@ MODEL_NAME = model_config["name"]
 PROMPT_TOKEN_COST = model_config["prompt_token_cost"]
 COMPLETION_TOKEN_COST = model_config["completion_token_cost"]
 
+# Force the model to answer through the routing tool
+TOOL_CHOICE = {"type": "function", "function": {"name": "route_query"}}
+
+# Tool definitions serialized once for building cache keys
+TOOL_DEFINITIONS_JSON = orjson.dumps(TOOL_DEFINITIONS)
+
+# Exact-match decision cache, only consulted for deterministic (temperature 0)
+# calls. The key covers the full message list, so any change to the
+# conversation or the fiscal context misses.
+_decision_cache = ResponseCache(
+    max_entries=CACHE_MAX_ENTRIES, default_ttl=CACHE_TTL_SECONDS
+)
+
+
+@lru_cache(maxsize=1)
+def _system_message():
+    """
+    Build the router system message on first use and share it across calls.
+
+    The dict is never mutated: the OpenAI client only reads it, so one instance
+    serves every request.
+    """
+    return cacheable_system_message(construct_system_prompt())
+
 
 class RouterError(Exception):
     """Base exception class for router-related errors."""
@@ -61,16 +92,28 @@ def get_routing_decision(conversation, token):
         RouterError: If there is an error in getting the routing decision
     """
     try:
-        # Prepare system message with router prompt
-        system_message = {"role": "system", "content": SYSTEM_PROMPT}
-
-        # Prepare the messages for the API call
-        messages = [system_message]
-        if conversation and "messages" in conversation:
-            messages.extend(conversation["messages"])
+        # Static system prompt first so it can be served from the prompt cache,
+        # followed by the date-dependent context and the conversation
+        dynamic_message = {"role": "system", "content": construct_dynamic_context()}
+        messages = [
+            _system_message(),
+            dynamic_message,
+            *(conversation or {}).get("messages", ()),
+        ]
+
+        cache_key = None
+        if TEMPERATURE == 0:
+            cache_key = make_cache_key(
+                MODEL_NAME, messages, TOOL_DEFINITIONS_JSON, TOOL_CHOICE
+            )
+            cached_decision = _decision_cache.get(cache_key)
+            if cached_decision is not None:
+                logger.info(
+                    f"Routing decision served from cache: {cached_decision['function_name']}"
+                )
+                return cached_decision
 
         logger.info(f"Getting routing decision using model: {MODEL_NAME}")
-        logger.info("Initiating Router API call")  # Added contextual log
 
         # Make the API call with tool calling
         response = call_llm(
@@ -80,24 +123,18 @@ def get_routing_decision(conversation, token):
             max_tokens=MAX_TOKENS,
             temperature=TEMPERATURE,
             tools=TOOL_DEFINITIONS,
-            tool_choice={
-                "type": "function",
-                "function": {"name": "route_query"},
-            },  # Force tool call
+            tool_choice=TOOL_CHOICE,
             stream=False,
             prompt_token_cost=PROMPT_TOKEN_COST,
             completion_token_cost=COMPLETION_TOKEN_COST,
         )
         # Extract the tool call from the response
-        if (
-            not response.choices
-            or not response.choices[0].message
-            or not response.choices[0].message.tool_calls
-            or not response.choices[0].message.tool_calls[0]
-        ):
+        try:
+            tool_call = response.choices[0].message.tool_calls[0]
+        except (AttributeError, IndexError, TypeError):
+            raise RouterError("No tool call received in response")
+        if tool_call is None:
             raise RouterError("No tool call received in response")
-
-        tool_call = response.choices[0].message.tool_calls[0]
 
         # Verify that the correct function was called
         if tool_call.function.name != "route_query":
@@ -106,8 +143,8 @@ def get_routing_decision(conversation, token):
 
         # Parse the arguments
         try:
-            arguments = json.loads(tool_call.function.arguments)
-        except json.JSONDecodeError:
+            arguments = orjson.loads(tool_call.function.arguments)
+        except orjson.JSONDecodeError:
             err_arg = tool_call.function.arguments
             # Break long f-string assignment
             msg = f"Invalid JSON in tool arguments: {err_arg}"
@@ -122,7 +159,11 @@ def get_routing_decision(conversation, token):
         # Log the routing decision
         logger.info(f"Routing decision: {function_name}")
 
-        return {"function_name": function_name}
+        decision = {"function_name": function_name}
+        if cache_key is not None:
+            _decision_cache.set(cache_key, decision, ttl=CACHE_TTL_SECONDS)
+
+        return decision
 
     except Exception as e:
         logger.error(f"Error getting routing decision: {str(e)}")
@@ -17,14 +17,18 @@ Attributes:
     TEMPERATURE (float): Randomness parameter (0-1)
     SYSTEM_PROMPT (str): System prompt template defining the router role
     TOOL_DEFINITIONS (list): Tool definitions for router tool calling
+    CACHE_MAX_ENTRIES (int): Maximum number of decisions held in the response cache
+    CACHE_TTL_SECONDS (int): Time-to-live in seconds for cached decisions
 """
 
 import logging
+from functools import lru_cache
 
 from ...global_prompts.project_statement import get_project_statement
 from ...global_prompts.database_statement import get_database_statement
 from ...global_prompts.fiscal_calendar import get_fiscal_statement
 from ...global_prompts.restrictions_statement import get_restrictions_statement
+from ...global_prompts.prompt_utils import build_costar_prompt
 
 # Get module logger (no configuration here - using centralized config)
 logger = logging.getLogger(__name__)
@@ -36,6 +40,10 @@ MODEL_CAPABILITY = "small"
 MAX_TOKENS = 4096
 TEMPERATURE = 0.0
 
+# Response cache settings (decisions are only cached for temperature 0 calls)
+CACHE_MAX_ENTRIES = 256
+CACHE_TTL_SECONDS = 3600
+
 # Define the router agent role
 ROUTER_ROLE = "an expert routing agent in the IRIS workflow"
 
@@ -253,43 +261,47 @@ No additional text or explanation should be included.
 
 
 # Construct the complete system prompt by combining the necessary statements
+@lru_cache(maxsize=1)
 def construct_system_prompt():
-    # Get all the required statements
-    project_statement = get_project_statement()
-    fiscal_statement = get_fiscal_statement()
+    # Only static statements belong here: the prompt is sent as a cacheable
+    # prefix, so anything date-dependent goes in construct_dynamic_context
+    project_statement = get_project_statement(include_timestamp=False)
     database_statement = get_database_statement()
     restrictions_statement = get_restrictions_statement()
 
     # Combine into a formatted system prompt using CO-STAR framework
-    prompt_parts = [
-        "<CONTEXT>",
-        project_statement,
-        fiscal_statement,
-        database_statement,
-        restrictions_statement,
-        "</CONTEXT>",
-        "<OBJECTIVE>",
-        ROUTER_OBJECTIVE,
-        "</OBJECTIVE>",
-        "<STYLE>",
-        ROUTER_STYLE,
-        "</STYLE>",
-        "<TONE>",
-        ROUTER_TONE,
-        "</TONE>",
-        "<AUDIENCE>",
-        ROUTER_AUDIENCE,
-        "</AUDIENCE>",
-        f"You are {ROUTER_ROLE}.",
-        ROUTER_TASK,
-    ]
-
-    # Join with double newlines for readability
-    return "\n\n".join(prompt_parts)
-
-
-# Generate the complete system prompt
-SYSTEM_PROMPT = construct_system_prompt()
+    return build_costar_prompt(
+        context_parts=[
+            project_statement,
+            database_statement,
+            restrictions_statement,
+        ],
+        objective=ROUTER_OBJECTIVE,
+        style=ROUTER_STYLE,
+        tone=ROUTER_TONE,
+        audience=ROUTER_AUDIENCE,
+        role=ROUTER_ROLE,
+        task=ROUTER_TASK,
+    )
+
+
+def construct_dynamic_context():
+    """
+    Build the per-request context that follows the static system prompt.
+
+    Returns:
+        str: Current fiscal context statement
+    """
+    return get_fiscal_statement()
+
+
+def __getattr__(name):
+    # SYSTEM_PROMPT is built on first access rather than at import, so processes
+    # that never reach the router do not pay for prompt assembly
+    if name == "SYSTEM_PROMPT":
+        return construct_system_prompt()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Tool definition for routing decisions
 TOOL_DEFINITIONS = [
@@ -15,23 +15,63 @@ Dependencies:
 """
 
 import logging
+from functools import lru_cache
 import json
 from typing import Any, Dict, List, Optional, Union, Generator
 
 from ...chat_model.model_settings import get_model_config
 
-from ...llm_connectors.rbc_openai import call_llm, log_usage_statistics
+from ...llm_connectors.rbc_openai import (
+    cacheable_system_message,
+    call_llm,
+    log_usage_statistics,
+)
 from .summarizer_settings import (
     AVAILABLE_DATABASES,
+    MAX_RESEARCH_CHARS_PER_DATABASE,
     MAX_TOKENS,
     MODEL_CAPABILITY,
-    SYSTEM_PROMPT,
     TEMPERATURE,
+    construct_system_prompt,
+    construct_dynamic_context,
 )
 
 # Get module logger
 logger = logging.getLogger(__name__)
 
+# Response when there are no research findings to summarize
+NO_FINDINGS_MESSAGE = (
+    "No detailed research findings were returned from the selected databases, "
+    "so there is nothing to summarize. Please try rephrasing the question or "
+    "naming the relevant standard or policy area."
+)
+
+# The database names and summary request are fixed for the process, so the
+# display name lookup and request message are built once
+_DB_DISPLAY_NAMES = {
+    db_name: db_info.get("name", db_name)
+    for db_name, db_info in AVAILABLE_DATABASES.items()
+}
+_SUMMARY_REQUEST_MESSAGE = {
+    "role": "user",
+    "content": "Please generate the comprehensive research summary based on the provided context and requirements. Synthesize the findings from all sources into a single, coherent response.",
+}
+
+
+# Appended to research texts cut at MAX_RESEARCH_CHARS_PER_DATABASE
+TRUNCATION_MARKER = "\n...[research truncated]"
+
+
+@lru_cache(maxsize=1)
+def _system_message():
+    """
+    Build the summarizer system message on first use and share it across calls.
+
+    The dict is never mutated: the OpenAI client only reads it, so one instance
+    serves every request.
+    """
+    return cacheable_system_message(construct_system_prompt())
+
 
 class SummarizerError(Exception):
     """Base exception class for summarizer-related errors."""
@@ -39,6 +79,18 @@ class SummarizerError(Exception):
     pass
 
 
+def _trim_research(research_text: Any) -> str:
+    """Cap one database's research text so a single source cannot dominate the prompt."""
+    research_text = str(research_text)
+    if len(research_text) <= MAX_RESEARCH_CHARS_PER_DATABASE:
+        return research_text
+    logger.warning(
+        f"Truncating research text of {len(research_text)} characters to "
+        f"{MAX_RESEARCH_CHARS_PER_DATABASE}"
+    )
+    return research_text[:MAX_RESEARCH_CHARS_PER_DATABASE] + TRUNCATION_MARKER
+
+
 # --- Main Synchronous Summarizer Function ---
 def generate_streaming_summary(
     aggregated_detailed_research: Dict[
@@ -71,7 +123,12 @@ def generate_streaming_summary(
     logger.info(f"Generating final summary for scope: {scope}")
 
     # --- Research Scope ---
-    if scope == "research":
+    if scope == "research" and not aggregated_detailed_research:
+        # Nothing to synthesize, so the model would only restate the absence
+        logger.info("No detailed research findings; skipping summarizer LLM call.")
+        yield NO_FINDINGS_MESSAGE
+
+    elif scope == "research":
         try:
             # Get model configuration dynamically
             model_config = get_model_config(MODEL_CAPABILITY)
@@ -86,54 +143,44 @@ def generate_streaming_summary(
             raise SummarizerError(f"Configuration error: {config_err}")
 
         try:
-            # Prepare system message with summary prompt
-            system_message = {"role": "system", "content": SYSTEM_PROMPT}
-
-            # Prepare messages for the API call
-            messages = [system_message]
-
             # Format the aggregated detailed research for the prompt
-            research_context = "Aggregated Detailed Research Findings:\n\n"
-            if not aggregated_detailed_research:
-                research_context += (
-                    "No detailed research findings were provided or generated.\n"
-                )
-            else:
-                for db_name, research_text in aggregated_detailed_research.items():
-                    db_display_name = AVAILABLE_DATABASES.get(db_name, {}).get(
-                        "name", db_name
-                    )
-                    research_context += f"=== Findings from: {db_display_name} ===\n"
-                    research_context += f"{research_text}\n\n"
-
-            context_message = {"role": "system", "content": research_context.strip()}
-            messages.append(context_message)
+            # Sections are collected and joined once; research texts can be large
+            research_parts = ["Aggregated Detailed Research Findings:\n\n"]
+            for db_name, research_text in aggregated_detailed_research.items():
+                db_display_name = _DB_DISPLAY_NAMES.get(db_name, db_name)
+                research_parts.append(f"=== Findings from: {db_display_name} ===\n")
+                research_parts.append(_trim_research(research_text))
+                research_parts.append("\n\n")
+            research_context = "".join(research_parts).strip()
 
             # Add original query plan details if available
+            plan_messages = []
             if original_query_plan and original_query_plan.get("queries"):
-                plan_context = "Original Query Plan:\n"
+                plan_parts = ["Original Query Plan:\n"]
                 for i, q in enumerate(original_query_plan["queries"]):
                     db_identifier = q.get("database")
-                    db_display_name = AVAILABLE_DATABASES.get(db_identifier, {}).get(
-                        "name", db_identifier
+                    db_display_name = _DB_DISPLAY_NAMES.get(
+                        db_identifier, db_identifier
                     )
-                    plan_context += f"{i+1}. {db_display_name}: {q.get('query')}\n"
-                messages.append({"role": "system", "content": plan_context.strip()})
-
-            # User message requesting summary
-            user_message = {
-                "role": "user",
-                "content": "Please generate the comprehensive research summary based on the provided context and requirements. Synthesize the findings from all sources into a single, coherent response.",
-            }
-            messages.append(user_message)
+                    plan_parts.append(f"{i+1}. {db_display_name}: {q.get('query')}\n")
+                plan_context = "".join(plan_parts).strip()
+                plan_messages.append({"role": "system", "content": plan_context})
+
+            # Prepare messages for the API call in a single list display; the
+            # static system prompt comes first so it can be served from the
+            # prompt cache, followed by the date-dependent context
+            messages = [
+                _system_message(),
+                {"role": "system", "content": construct_dynamic_context()},
+                {"role": "system", "content": research_context},
+                *plan_messages,
+                _SUMMARY_REQUEST_MESSAGE,
+            ]
 
             logger.info(
-                f"Generating streaming research summary using model: {model_name}"
-            )
-            logger.info(
-                f"Summarizing detailed research from {len(aggregated_detailed_research)} databases."
+                f"Generating streaming research summary using model: {model_name} "
+                f"from {len(aggregated_detailed_research)} databases"
             )
-            logger.info("Initiating Summarizer stream API call")  # Added contextual log
 
             # --- Synchronous LLM Call ---
             # Directly call the synchronous call_llm function
@@ -15,11 +15,14 @@ Attributes:
     MODEL_CAPABILITY (str): The model capability to use ('small' or 'large')
     MAX_TOKENS (int): Maximum tokens for model response
     TEMPERATURE (float): Randomness parameter (0-1)
+    MAX_RESEARCH_CHARS_PER_DATABASE (int): Longest research text sent to the
+        model for a single database; longer texts are truncated
     SYSTEM_PROMPT (str): System prompt template defining the summarizer role
     AVAILABLE_DATABASES (dict): Information about available databases
 """
 
 import logging
+from functools import lru_cache
 
 from ...global_prompts.project_statement import get_project_statement
 from ...global_prompts.database_statement import (
@@ -28,6 +31,7 @@ from ...global_prompts.database_statement import (
 )
 from ...global_prompts.fiscal_calendar import get_fiscal_statement
 from ...global_prompts.restrictions_statement import get_restrictions_statement
+from ...global_prompts.prompt_utils import build_costar_prompt
 
 # Get module logger (no configuration here - using centralized config)
 logger = logging.getLogger(__name__)
@@ -42,6 +46,9 @@ MODEL_CAPABILITY = "large"
 MAX_TOKENS = 4096
 TEMPERATURE = 0.1  # Slightly higher temp might allow for more nuanced summaries
 
+# Input limits (about 4 characters per token)
+MAX_RESEARCH_CHARS_PER_DATABASE = 24000
+
 # Define the summarizer agent role and task
 SUMMARIZER_ROLE = (
     "an expert research analyst specializing in synthesizing complex information"
@@ -210,38 +217,8 @@ For 'research' scope:
 """
 
 
-# Construct the complete system prompt by combining the necessary statements
-def construct_system_prompt():
-    # Get all the required statements
-    project_statement = get_project_statement()
-    fiscal_statement = get_fiscal_statement()
-    # database_statement = get_database_statement() # Removed database statement
-    restrictions_statement = get_restrictions_statement()
-
-    # Combine into a formatted system prompt using CO-STAR framework
-    prompt_parts = [
-        "<CONTEXT>",
-        project_statement,
-        fiscal_statement,
-        # database_statement, # Removed database statement
-        restrictions_statement,
-        "</CONTEXT>",
-        "<OBJECTIVE>",
-        SUMMARIZER_OBJECTIVE,
-        "</OBJECTIVE>",
-        "<STYLE>",
-        SUMMARIZER_STYLE,
-        "</STYLE>",
-        "<TONE>",
-        SUMMARIZER_TONE,
-        "</TONE>",
-        "<AUDIENCE>",
-        SUMMARIZER_AUDIENCE,
-        "</AUDIENCE>",
-        f"You are {SUMMARIZER_ROLE}.",
-        SUMMARIZER_TASK,  # Existing task definition
-        # --- INSERT EXAMPLES HERE ---
-        """<CITATION_INTEGRATION_EXAMPLES>
+# Worked examples of integrating report citations, placed after the task
+CITATION_INTEGRATION_EXAMPLES = """<CITATION_INTEGRATION_EXAMPLES>
 Here's how to integrate citations from the internal research reports (provided as input below, structured using basic Markdown) into your final synthesized answer:
 
 **Example 1: Specific Derivative Hedging Conclusion**
@@ -312,18 +289,56 @@ Based on the official standard, IFRS 15 mandates the identification of distinct
 
 Regarding the capitalization of internally developed software costs, the internal policy mandates expensing costs from the preliminary project stage (Source: CAPM Policy SoftwareDev IAS38, Section: 5.2.1) and explicitly prohibits capitalizing training costs (Source: CAPM Policy SoftwareDev IAS38, Section: 5.4.b). Costs from the application development stage are capitalizable only if specific criteria are met (Source: CAPM Policy SoftwareDev IAS38, Section: 5.3). However, there appears to be differing external guidance regarding cloud computing arrangements (SaaS); EY's guidance suggests certain configuration costs might be capitalizable if they meet the definition of an intangible asset (Source: EY Global IFRS Update - SaaS Costs, Issue 12, Page 5), which potentially conflicts with interpretations expensing most such costs. Further analysis may be needed to reconcile the internal policy with this external perspective for SaaS arrangements.
 </CITATION_INTEGRATION_EXAMPLES>
-""",
-        # --- END EXAMPLES ---
-        PATTERN_RECOGNITION_INSTRUCTIONS,
-        CONFIDENCE_SIGNALING,
-        SUMMARIZER_SPECIFIC_GUARDRAILS,
-    ]
+"""
 
-    # Join with double newlines for readability
-    return "\n\n".join(prompt_parts)
 
+# Construct the complete system prompt by combining the necessary statements
+@lru_cache(maxsize=1)
+def construct_system_prompt():
+    # Only static statements belong here: the prompt is sent as a cacheable
+    # prefix, so anything date-dependent goes in construct_dynamic_context
+    project_statement = get_project_statement(include_timestamp=False)
+    # database_statement = get_database_statement() # Removed database statement
+    restrictions_statement = get_restrictions_statement()
+
+    # Combine into a formatted system prompt using CO-STAR framework
+    return build_costar_prompt(
+        context_parts=[
+            project_statement,
+            # database_statement, # Removed database statement
+            restrictions_statement,
+        ],
+        objective=SUMMARIZER_OBJECTIVE,
+        style=SUMMARIZER_STYLE,
+        tone=SUMMARIZER_TONE,
+        audience=SUMMARIZER_AUDIENCE,
+        role=SUMMARIZER_ROLE,
+        task=SUMMARIZER_TASK,
+        extra_parts=[
+            CITATION_INTEGRATION_EXAMPLES,
+            PATTERN_RECOGNITION_INSTRUCTIONS,
+            CONFIDENCE_SIGNALING,
+            SUMMARIZER_SPECIFIC_GUARDRAILS,
+        ],
+    )
+
+
+def construct_dynamic_context():
+    """
+    Build the per-request context that follows the static system prompt.
+
+    Returns:
+        str: Current fiscal context statement
+    """
+    return get_fiscal_statement()
+
+
+def __getattr__(name):
+    # SYSTEM_PROMPT is built on first access rather than at import, so processes
+    # that never reach the summarizer do not pay for prompt assembly
+    if name == "SYSTEM_PROMPT":
+        return construct_system_prompt()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Generate the complete system prompt
-SYSTEM_PROMPT = construct_system_prompt()
 
 logger.debug("Summarizer agent settings initialized")
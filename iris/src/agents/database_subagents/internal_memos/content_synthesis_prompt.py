@@ -68,7 +68,8 @@ def get_content_synthesis_prompt(user_query: str, formatted_documents: str) -> s
     """
     # Fetch all global context statements
     project_statement = get_project_statement()
-    database_statement = get_database_statement()
+    # Only this subagent's database is relevant to synthesizing its results
+    database_statement = get_database_statement(["internal_memos"])
     fiscal_statement = get_fiscal_statement()
     restrictions_statement = get_restrictions_statement()
 
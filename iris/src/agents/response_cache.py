@@ -0,0 +1,436 @@
+# python/iris/src/agents/response_cache.py
+"""
+Agent Response Cache
+
+This module provides caches for parsed agent responses, shared by the agents
+that make deterministic tool calls. An agent running at temperature 0.0 with a
+fixed system prompt and tool schema produces identical responses for identical
+requests, so repeated requests can be answered without an LLM round-trip. A
+similarity-based cache catches rephrasings of the latest user message that
+exact matching would miss, and a disk-backed cache keeps exact-match responses
+across process restarts.
+
+Classes:
+    ResponseCache: Thread-safe LRU cache with per-entry expiry
+    SemanticResponseCache: Near-duplicate cache keyed on the latest user message
+    DiskResponseCache: Persistent exact-match cache backed by SQLite
+
+Functions:
+    make_cache_key: Build a deterministic cache key for an agent request
+
+Dependencies:
+    - hashlib
+    - logging
+    - math
+    - orjson
+    - os
+    - re
+    - sqlite3
+    - threading
+    - time
+"""
+
+import hashlib
+import logging
+import math
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import Counter, OrderedDict
+from typing import Any, Dict, List, Optional
+
+import orjson
+
+# Get module logger (no configuration here - using centralized config)
+logger = logging.getLogger(__name__)
+
+# Word tokens used to build the lexical vectors for similarity matching
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Terms a bag-of-words similarity cannot weigh but that change the meaning of a
+# request: numbers (standard and paragraph numbers, years), standard names, and
+# negations. Near-duplicates must contain exactly the same ones.
+_EXACT_TERM_PATTERN = re.compile(
+    r"\d+(?:\.\d+)*"
+    r"|\b(?:ifrs|ias|ifric|sic|asc|gaap|aspe)\b"
+    r"|\b(?:not|no|never|nor|none|cannot|without)\b"
+    r"|n't",
+    re.IGNORECASE,
+)
+
+
+def make_cache_key(
+    model: str,
+    messages: List[Dict[str, Any]],
+    tools_json: bytes,
+    tool_choice: Any,
+) -> str:
+    """
+    Build a deterministic cache key for an agent request.
+
+    Args:
+        model (str): Model name used for the request
+        messages (list): Messages sent to the model, including the system prompt
+        tools_json (bytes): Pre-serialized tool definitions sent with the request
+        tool_choice (dict/str): Tool choice specification
+
+    Returns:
+        str: Hex-encoded SHA-256 digest of the canonicalized request
+    """
+    digest = hashlib.sha256(tools_json)
+    digest.update(
+        orjson.dumps(
+            {"model": model, "messages": messages, "tool_choice": tool_choice},
+            option=orjson.OPT_SORT_KEYS,
+        )
+    )
+    return digest.hexdigest()
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU cache for agent responses with per-entry expiry.
+
+    Entries are evicted in least-recently-used order once max_entries is
+    reached, and are treated as missing once their TTL has elapsed.
+    """
+
+    def __init__(self, max_entries: int = 256, default_ttl: float = 3600):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries (int): Maximum number of responses held in memory
+            default_ttl (float): Default time-to-live in seconds for new entries
+        """
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached response.
+
+        Args:
+            key (str): Cache key from make_cache_key
+
+        Returns:
+            dict or None: A copy of the cached response, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, response = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return dict(response)
+
+    def set(
+        self, key: str, response: Dict[str, Any], ttl: Optional[float] = None
+    ) -> None:
+        """
+        Store a response in the cache.
+
+        Args:
+            key (str): Cache key from make_cache_key
+            response (dict): Parsed agent response to store
+            ttl (float, optional): Time-to-live in seconds. Defaults to default_ttl.
+        """
+        expires_at = time.monotonic() + (ttl if ttl is not None else self.default_ttl)
+
+        with self._lock:
+            self._entries[key] = (expires_at, dict(response))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+def _vectorize(text: str) -> Counter:
+    """Build a bag-of-words vector for the given text."""
+    return Counter(_TOKEN_PATTERN.findall(text.lower()))
+
+
+def _exact_terms(text: str) -> tuple:
+    """Sorted numbers, standard names and negations found in the text."""
+    return tuple(sorted(term.lower() for term in _EXACT_TERM_PATTERN.findall(text)))
+
+
+def _cosine_similarity(a: Counter, a_norm: float, b: Counter, b_norm: float) -> float:
+    """Cosine similarity between two bag-of-words vectors with known norms."""
+    if not a_norm or not b_norm:
+        return 0.0
+    if len(a) > len(b):
+        a, b = b, a
+    dot = sum(count * b[token] for token, count in a.items())
+    return dot / (a_norm * b_norm)
+
+
+class SemanticResponseCache:
+    """
+    Near-duplicate cache for agent responses.
+
+    A cached response is reused when the prior conversation (every message
+    except the latest) is identical and the latest user message is a close
+    rephrasing of a cached one, measured by cosine similarity of word counts.
+    Word counts cannot tell "IFRS 15" from "IFRS 16" or "allowed" from "not
+    allowed", so a match also requires exactly the same numbers, standard names
+    and negations. Requests whose latest message matches bypass_pattern are
+    never cached.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.97,
+        max_entries: int = 256,
+        default_ttl: float = 3600,
+        bypass_pattern: Optional[re.Pattern] = None,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            threshold (float): Minimum cosine similarity for a cache hit
+            max_entries (int): Maximum number of responses held in memory
+            default_ttl (float): Default time-to-live in seconds for new entries
+            bypass_pattern (re.Pattern, optional): Latest messages matching this
+                pattern depend on the preceding exchange and bypass the cache
+        """
+        self.threshold = threshold
+        self.bypass_pattern = bypass_pattern
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        # Entries keyed by (context hash, latest message text), oldest first
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _split(self, messages: List[Dict[str, Any]]) -> Optional[tuple]:
+        """
+        Split messages into a hash of the prior context and the latest user text.
+
+        Returns:
+            tuple or None: (context_hash, latest_text), or None if the request
+                should bypass the cache
+        """
+        if not messages or messages[-1].get("role") != "user":
+            return None
+
+        latest_text = messages[-1].get("content")
+        if not isinstance(latest_text, str) or not latest_text.strip():
+            return None
+        if self.bypass_pattern and self.bypass_pattern.search(latest_text):
+            return None
+
+        context = orjson.dumps(messages[:-1], option=orjson.OPT_SORT_KEYS)
+        context_hash = hashlib.sha256(context).hexdigest()
+        return context_hash, latest_text
+
+    def get(
+        self, model: str, messages: List[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Look up a response cached for a near-identical request.
+
+        Args:
+            model (str): Model name used for the request
+            messages (list): Messages sent to the model, including the system prompt
+
+        Returns:
+            dict or None: A copy of the best matching response, or None on a miss
+        """
+        split = self._split(messages)
+        if split is None:
+            return None
+        context_hash, latest_text = split
+
+        vector = _vectorize(latest_text)
+        norm = math.sqrt(sum(count * count for count in vector.values()))
+        exact_terms = _exact_terms(latest_text)
+        now = time.monotonic()
+
+        best_score = 0.0
+        best_key = None
+        with self._lock:
+            for key, entry in list(self._entries.items()):
+                entry_model, expires_at, entry_terms, entry_vector, entry_norm, _ = (
+                    entry
+                )
+                if expires_at <= now:
+                    del self._entries[key]
+                    continue
+                if (
+                    key[0] != context_hash
+                    or entry_model != model
+                    or entry_terms != exact_terms
+                ):
+                    continue
+                score = _cosine_similarity(vector, norm, entry_vector, entry_norm)
+                if score > best_score:
+                    best_score, best_key = score, key
+
+            if best_key is None or best_score < self.threshold:
+                return None
+
+            self._entries.move_to_end(best_key)
+            logger.debug(f"Semantic response cache hit (similarity {best_score:.3f})")
+            return dict(self._entries[best_key][5])
+
+    def set(
+        self,
+        model: str,
+        messages: List[Dict[str, Any]],
+        response: Dict[str, Any],
+        ttl: Optional[float] = None,
+    ) -> None:
+        """
+        Store a response for similarity lookups.
+
+        Args:
+            model (str): Model name used for the request
+            messages (list): Messages sent to the model, including the system prompt
+            response (dict): Parsed agent response to store
+            ttl (float, optional): Time-to-live in seconds. Defaults to default_ttl.
+        """
+        split = self._split(messages)
+        if split is None:
+            return
+
+        vector = _vectorize(split[1])
+        norm = math.sqrt(sum(count * count for count in vector.values()))
+        expires_at = time.monotonic() + (ttl if ttl is not None else self.default_ttl)
+
+        with self._lock:
+            self._entries[split] = (
+                model,
+                expires_at,
+                _exact_terms(split[1]),
+                vector,
+                norm,
+                dict(response),
+            )
+            self._entries.move_to_end(split)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+class DiskResponseCache:
+    """
+    Persistent exact-match cache for agent responses backed by SQLite.
+
+    Sits behind the in-memory caches so reruns of the same conversations (replays,
+    pipeline retries after a restart) skip the LLM call. Storage errors, including
+    an unusable cache directory, are logged and treated as cache misses; the
+    cache never fails an agent request.
+    """
+
+    def __init__(self, directory: str, default_ttl: float = 7 * 24 * 3600):
+        """
+        Initialize the cache. The database is created on first use.
+
+        Args:
+            directory (str): Directory holding the cache database
+            default_ttl (float): Default time-to-live in seconds for new entries
+        """
+        self.path = os.path.join(os.path.expanduser(directory), "responses.sqlite3")
+        self.default_ttl = default_ttl
+        self._initialized = False
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection, creating the database and table on first use."""
+        if not self._initialized:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=5)
+        if not self._initialized:
+            with connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS responses ("
+                    "key TEXT PRIMARY KEY, expires_at REAL NOT NULL, response BLOB NOT NULL)"
+                )
+            self._initialized = True
+        return connection
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached response.
+
+        Args:
+            key (str): Cache key from make_cache_key
+
+        Returns:
+            dict or None: The cached response, or None on a miss or storage error
+        """
+        try:
+            with self._lock:
+                connection = self._connect()
+                try:
+                    row = connection.execute(
+                        "SELECT expires_at, response FROM responses WHERE key = ?",
+                        (key,),
+                    ).fetchone()
+                finally:
+                    connection.close()
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Disk response cache read failed: {str(e)}")
+            return None
+
+        # Wall-clock time, since entries must stay valid across processes
+        if row is None or row[0] <= time.time():
+            return None
+        return orjson.loads(row[1])
+
+    def set(
+        self, key: str, response: Dict[str, Any], ttl: Optional[float] = None
+    ) -> None:
+        """
+        Store a response in the cache and drop expired entries.
+
+        Args:
+            key (str): Cache key from make_cache_key
+            response (dict): Parsed agent response to store
+            ttl (float, optional): Time-to-live in seconds. Defaults to default_ttl.
+        """
+        now = time.time()
+        expires_at = now + (ttl if ttl is not None else self.default_ttl)
+
+        try:
+            with self._lock:
+                connection = self._connect()
+                try:
+                    with connection:
+                        connection.execute(
+                            "INSERT OR REPLACE INTO responses VALUES (?, ?, ?)",
+                            (key, expires_at, orjson.dumps(response)),
+                        )
+                        connection.execute(
+                            "DELETE FROM responses WHERE expires_at <= ?", (now,)
+                        )
+                finally:
+                    connection.close()
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Disk response cache write failed: {str(e)}")
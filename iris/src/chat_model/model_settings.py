@@ -15,10 +15,12 @@ Functions:
     get_model_config: Returns model configuration based on capability and environment
 
 Dependencies:
+    - functools
     - logging
 """
 
 import logging
+from functools import lru_cache
 
 # Get module logger
 logger = logging.getLogger(__name__)
@@ -70,9 +72,14 @@ MODELS = {
 
 # Request settings
 REQUEST_TIMEOUT = 180  # Timeout in seconds for API requests (3 minutes)
-MAX_RETRY_ATTEMPTS = 3  # Maximum number of retry attempts
-RETRY_DELAY_SECONDS = 2  # Delay between retry attempts in seconds
+MAX_RETRY_ATTEMPTS = 4  # Maximum number of attempts for transient API errors
+RETRY_DELAY_SECONDS = 1  # Base delay for exponential backoff between attempts
+RETRY_MAX_DELAY_SECONDS = 30  # Upper bound on the delay between attempts
 TOKEN_PREVIEW_LENGTH = 7  # Number of characters to show in token preview
+MAX_POOLED_CLIENTS = 8  # API clients (one per token) kept alive for connection reuse
+PROMPT_CACHE_MARKERS = (
+    False  # Whether the endpoint accepts cache_control markers on content blocks
+)
 
 # Usage display settings
 SHOW_USAGE_SUMMARY = (
@@ -80,10 +87,14 @@ SHOW_USAGE_SUMMARY = (
 )
 
 
+@lru_cache(maxsize=4)
 def get_model_config(capability):
     """
     Get model configuration based on capability and current environment.
 
+    The environment is fixed at import, so each capability is resolved (and
+    logged) once; callers share the returned dict and must not modify it.
+
     Args:
         capability (str): The model capability ('small' or 'large')
 
@@ -7,6 +7,8 @@ This module serves as the single source of truth for database information across
 """
 
 import logging
+from functools import lru_cache
+from typing import FrozenSet, Iterable, Optional
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -88,26 +90,37 @@ AVAILABLE_DATABASES = {
 }
 
 
-def get_database_statement() -> str:
+def get_database_statement(database_ids: Optional[Iterable[str]] = None) -> str:
     """
     Returns a formatted statement about available databases for use in agent prompts.
     Uses XML-style delimiters for better sectioning.
 
+    Args:
+        database_ids (iterable, optional): Restrict the statement to these
+            databases. Defaults to all available databases.
+
     Returns:
         str: Formatted statement describing available databases
     """
+    selected = None if database_ids is None else frozenset(database_ids)
+    return _build_database_statement(selected)
+
+
+@lru_cache(maxsize=64)
+def _build_database_statement(selected: Optional[FrozenSet[str]]) -> str:
+    """Build the database statement for a selection (None for all databases)."""
     statement = """<AVAILABLE_DATABASES>
 The following databases are available for research:
 
 """
 
+    databases = AVAILABLE_DATABASES
+    if selected is not None:
+        databases = {k: v for k, v in AVAILABLE_DATABASES.items() if k in selected}
+
     # Group databases by type for better organization
-    internal_dbs = {
-        k: v for k, v in AVAILABLE_DATABASES.items() if k.startswith("internal_")
-    }
-    external_dbs = {
-        k: v for k, v in AVAILABLE_DATABASES.items() if k.startswith("external_")
-    }
+    internal_dbs = {k: v for k, v in databases.items() if k.startswith("internal_")}
+    external_dbs = {k: v for k, v in databases.items() if k.startswith("external_")}
 
     # Add internal databases section
     statement += "<INTERNAL_DATABASES>\n"
@@ -8,6 +8,7 @@ Fiscal year runs from November 1 to October 31.
 
 import logging
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Dict, Tuple
 
 # Configure logging
@@ -120,25 +121,30 @@ def get_fiscal_statement() -> str:
     Generate a natural language statement about the current fiscal period.
     Uses XML-style delimiters for better sectioning.
 
+    The statement only changes with the date, so it is built once per day.
+
     Returns:
         str: Formatted fiscal statement
     """
     try:
-        current_date = datetime.now()
-        formatted_date = current_date.strftime("%Y-%m-%d")  # Format as YYYY-MM-DD
-        fiscal_year, fiscal_quarter = get_fiscal_period()
-        current_quarter_range = get_quarter_range_str(fiscal_quarter)
+        formatted_date = datetime.now().strftime("%Y-%m-%d")  # Format as YYYY-MM-DD
+        return _fiscal_statement_for_date(formatted_date)
+    except Exception as e:
+        logger.error(f"Error generating fiscal statement: {str(e)}")
+        # Fallback statement in case of errors
+        return "<FISCAL_CONTEXT>We operate on a fiscal year that runs from November 1st through October 31st.</FISCAL_CONTEXT>"
+
 
-        statement = f"""<FISCAL_CONTEXT>
+@lru_cache(maxsize=1)
+def _fiscal_statement_for_date(formatted_date: str) -> str:
+    """Build the fiscal statement for the given date (YYYY-MM-DD)."""
+    fiscal_year, fiscal_quarter = get_fiscal_period()
+    current_quarter_range = get_quarter_range_str(fiscal_quarter)
+
+    return f"""<FISCAL_CONTEXT>
 <CURRENT_DATE>{formatted_date}</CURRENT_DATE>
 <FISCAL_YEAR>{fiscal_year} (FY{fiscal_year})</FISCAL_YEAR>
 <FISCAL_QUARTER>{fiscal_quarter} (Q{fiscal_quarter})</FISCAL_QUARTER>
 <QUARTER_RANGE>{current_quarter_range}</QUARTER_RANGE>
 <FISCAL_YEAR_DEFINITION>Our fiscal year runs from November 1st through October 31st.</FISCAL_YEAR_DEFINITION>
 </FISCAL_CONTEXT>"""
-
-        return statement
-    except Exception as e:
-        logger.error(f"Error generating fiscal statement: {str(e)}")
-        # Fallback statement in case of errors
-        return "<FISCAL_CONTEXT>We operate on a fiscal year that runs from November 1st through October 31st.</FISCAL_CONTEXT>"
@@ -13,19 +13,26 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-def get_project_statement() -> str:
+def get_project_statement(include_timestamp: bool = True) -> str:
     """
     Generate the project context statement with XML-style delimiters.
 
+    Args:
+        include_timestamp (bool): Whether to stamp the statement with the current
+            time. Disable for prompts that must stay byte-identical across calls.
+
     Returns:
         str: Formatted project statement
     """
     try:
         from datetime import datetime
 
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        opening_tag = "<PROJECT_CONTEXT>"
+        if include_timestamp:
+            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            opening_tag = f'<PROJECT_CONTEXT timestamp="{current_time}">'
 
-        statement = f"""<PROJECT_CONTEXT timestamp="{current_time}">
+        statement = f"""{opening_tag}
 This project serves RBC's Accounting Policy Group by implementing an intelligent research and response system for accounting policy inquiries. The system combines comprehensive internal and external accounting policy documentation with an autonomous agent-based RAG (Retrieval-Augmented Generation) process. Users can engage in natural conversations about accounting policies, and the system will independently research and generate responses as needed.
 
 <KNOWLEDGE_SOURCES>
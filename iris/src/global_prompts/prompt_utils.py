@@ -0,0 +1,60 @@
+# global_prompts/prompt_utils.py
+"""
+Prompt Assembly Utility
+
+Provides the CO-STAR layout shared by the agent system prompts, so each agent
+only supplies its context statements and role-specific sections.
+"""
+
+from typing import Iterable
+
+
+def build_costar_prompt(
+    context_parts: Iterable[str],
+    objective: str,
+    style: str,
+    tone: str,
+    audience: str,
+    role: str,
+    task: str,
+    extra_parts: Iterable[str] = (),
+) -> str:
+    """
+    Assemble a system prompt using the CO-STAR framework.
+
+    Args:
+        context_parts (iterable): Statements placed inside the CONTEXT section
+        objective (str): Agent objective
+        style (str): Response style guidance
+        tone (str): Response tone guidance
+        audience (str): Intended audience description
+        role (str): Agent role, completing the sentence "You are ..."
+        task (str): Agent task instructions
+        extra_parts (iterable, optional): Sections appended after the task
+
+    Returns:
+        str: Complete system prompt, sections separated by blank lines
+    """
+    prompt_parts = [
+        "<CONTEXT>",
+        *context_parts,
+        "</CONTEXT>",
+        "<OBJECTIVE>",
+        objective,
+        "</OBJECTIVE>",
+        "<STYLE>",
+        style,
+        "</STYLE>",
+        "<TONE>",
+        tone,
+        "</TONE>",
+        "<AUDIENCE>",
+        audience,
+        "</AUDIENCE>",
+        f"You are {role}.",
+        task,
+        *extra_parts,
+    ]
+
+    # Join with double newlines for readability
+    return "\n\n".join(prompt_parts)
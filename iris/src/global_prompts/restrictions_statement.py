@@ -7,6 +7,7 @@ be applied across all agent responses for compliance and quality control.
 """
 
 import logging
+from functools import lru_cache
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -133,10 +134,12 @@ Example: "The available sources do not address this specific scenario. This woul
         return "<CONFIDENCE_SIGNALING>Indicate your level of confidence in responses based on the sources and context.</CONFIDENCE_SIGNALING>"
 
 
+@lru_cache(maxsize=1)
 def get_restrictions_statement() -> str:
     """
     Generate a combined restrictions and guidelines statement for use in prompts.
-    Includes confidence signaling guidelines.
+    Includes confidence signaling guidelines. The statement is fixed text, so it
+    is built once and reused.
 
     Returns:
         str: Formatted restrictions statement combining compliance, quality, and confidence guidelines
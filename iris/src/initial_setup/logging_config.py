@@ -4,18 +4,39 @@ Centralized Logging Configuration Module
 
 This module provides a consistent logging configuration for all modules
 in the application, preventing duplicate log messages and ensuring uniform
-log formatting across the application.
+log formatting across the application. Records are written to stderr by a
+background listener thread, so logging calls on request paths only enqueue
+the record and never wait on stream I/O.
 
 Functions:
     configure_logging: Sets up the root logger with appropriate handlers
 
 Dependencies:
+    - atexit
     - logging
+    - queue
     - sys
 """
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
+
+# Listener writing queued records to stderr, replaced on each reconfiguration
+_listener = None
+
+
+def _stop_listener():
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(_stop_listener)
 
 
 def configure_logging(level=logging.INFO):
@@ -32,21 +53,26 @@ def configure_logging(level=logging.INFO):
     Returns:
         logging.Logger: Configured root logger
     """
+    global _listener
+
     # Configure root logger
     root_logger = logging.getLogger()
 
     # Clear any existing handlers to avoid duplicates
-    if root_logger.handlers:
-        for handler in root_logger.handlers:
-            root_logger.removeHandler(handler)
+    for handler in list(root_logger.handlers):
+        root_logger.removeHandler(handler)
+    _stop_listener()
 
-    # Add a new handler
+    # Write records from a background thread; callers only enqueue them
     handler = logging.StreamHandler(sys.stderr)
     formatter = logging.Formatter(
         "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     )
     handler.setFormatter(formatter)
-    root_logger.addHandler(handler)
+    log_queue = queue.SimpleQueue()
+    _listener = QueueListener(log_queue, handler)
+    _listener.start()
+    root_logger.addHandler(QueueHandler(log_queue))
     root_logger.setLevel(level)
 
     logging.info("Logging system initialized")
@@ -0,0 +1,178 @@
+# python/iris/src/llm_connectors/openai_batch.py
+"""
+OpenAI Batch Connector Module
+
+This module submits chat completion requests as a single Batch API job and
+collects the completions once the job finishes, trading latency for the
+reduced batch pricing. Agents build each request with the same parameters they
+pass to call_llm and parse the returned completions with their usual response
+handling.
+
+Functions:
+    submit_batch: Upload call_llm parameter sets as a Batch API job
+    collect_batch: Wait for a Batch API job and return its completions
+
+Dependencies:
+    - logging
+    - openai
+    - orjson
+    - time
+    - RBC OpenAI connector (pooled clients)
+"""
+
+import logging
+import time
+from typing import Any, Dict, List, Union
+
+import orjson
+from openai.types.chat import ChatCompletion
+
+from ..chat_model.model_settings import BASE_URL
+from .rbc_openai import OpenAIConnectorError, _get_client
+
+# Get module logger (no configuration here - using centralized config)
+logger = logging.getLogger(__name__)
+
+# Endpoint the batch requests are replayed against
+BATCH_ENDPOINT = "/v1/chat/completions"
+
+# Batch job states after which no further progress will be made
+_TERMINAL_BATCH_STATES = {"completed", "failed", "expired", "cancelled"}
+
+# call_llm keyword arguments that are not part of the chat completions body
+_NON_BODY_PARAMS = {
+    "oauth_token",
+    "prompt_token_cost",
+    "completion_token_cost",
+    "stream",
+}
+
+
+def _batch_request_line(label: str, index: int, params: Dict[str, Any]) -> bytes:
+    """Serialize one set of call_llm parameters as a Batch API JSONL line."""
+    body = {k: v for k, v in params.items() if k not in _NON_BODY_PARAMS}
+    return orjson.dumps(
+        {
+            "custom_id": f"{label}-{index}",
+            "method": "POST",
+            "url": BATCH_ENDPOINT,
+            "body": body,
+        }
+    )
+
+
+def submit_batch(
+    label: str,
+    request_params: List[Dict[str, Any]],
+    token: str,
+    completion_window: str,
+) -> str:
+    """
+    Upload call_llm parameter sets as a Batch API job.
+
+    Args:
+        label (str): Name of the submitting agent, used for request IDs and logs
+        request_params (list): Keyword arguments the agent would pass to call_llm,
+            one dict per request
+        token (str): Authentication token for API access
+        completion_window (str): Batch API completion window (e.g. "24h")
+
+    Returns:
+        str: ID of the created batch job
+    """
+    client = _get_client(token, BASE_URL)
+
+    payload = b"\n".join(
+        _batch_request_line(label, index, params)
+        for index, params in enumerate(request_params)
+    )
+    input_file = client.files.create(
+        file=(f"{label}_batch.jsonl", payload), purpose="batch"
+    )
+    batch = client.batches.create(
+        input_file_id=input_file.id,
+        endpoint=BATCH_ENDPOINT,
+        completion_window=completion_window,
+    )
+
+    logger.info(
+        f"Submitted {label} batch {batch.id} with {len(request_params)} requests"
+    )
+    return batch.id
+
+
+def collect_batch(
+    label: str,
+    batch_id: str,
+    token: str,
+    request_count: int,
+    poll_interval: float,
+    max_wait: float,
+) -> List[Union[ChatCompletion, OpenAIConnectorError]]:
+    """
+    Wait for a Batch API job to finish and return its completions.
+
+    Args:
+        label (str): Name of the submitting agent, used for logs
+        batch_id (str): ID returned by submit_batch
+        token (str): Authentication token for API access
+        request_count (int): Number of requests submitted in the batch
+        poll_interval (float): Seconds between status checks
+        max_wait (float): Seconds to wait for the job before giving up. The job
+            keeps running and can be collected again with the same ID.
+
+    Returns:
+        list: One entry per submitted request, in input order. Each entry is
+            either the ChatCompletion or an OpenAIConnectorError describing why
+            that request produced no usable completion.
+
+    Raises:
+        OpenAIConnectorError: If the batch job ends without producing output,
+            or is still running after max_wait seconds
+    """
+    client = _get_client(token, BASE_URL)
+    deadline = time.monotonic() + max_wait
+
+    batch = client.batches.retrieve(batch_id)
+    while batch.status not in _TERMINAL_BATCH_STATES:
+        logger.info(f"{label.capitalize()} batch {batch_id} status: {batch.status}")
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise OpenAIConnectorError(
+                f"{label.capitalize()} batch {batch_id} still '{batch.status}' "
+                f"after {max_wait} seconds"
+            )
+        time.sleep(min(poll_interval, remaining))
+        batch = client.batches.retrieve(batch_id)
+
+    if not batch.output_file_id:
+        raise OpenAIConnectorError(
+            f"{label.capitalize()} batch {batch_id} finished with status "
+            f"'{batch.status}' and no output"
+        )
+
+    results: List[Union[ChatCompletion, OpenAIConnectorError]] = [
+        OpenAIConnectorError("No result returned for this request")
+        for _ in range(request_count)
+    ]
+    output = client.files.content(batch.output_file_id).content
+    for line in output.splitlines():
+        if not line.strip():
+            continue
+        record = orjson.loads(line)
+        index = int(record["custom_id"].rsplit("-", 1)[1])
+
+        response = record.get("response") or {}
+        if record.get("error") or response.get("status_code") != 200:
+            results[index] = OpenAIConnectorError(
+                f"Batch request failed: {record.get('error') or response.get('body')}"
+            )
+            continue
+
+        try:
+            results[index] = ChatCompletion.model_validate(response["body"])
+        except ValueError as e:
+            results[index] = OpenAIConnectorError(f"Malformed batch response: {str(e)}")
+
+    logger.info(f"Collected {label} batch {batch_id} ({batch.status})")
+    return results
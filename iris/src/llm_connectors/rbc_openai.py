@@ -10,25 +10,45 @@ Functions:
     calculate_cost: Calculates token usage costs
     log_usage_statistics: Logs token usage and costs
     call_llm: Makes a call to the OpenAI API with the given parameters
+    acall_llm: Async variant of call_llm for use inside an event loop
+    cacheable_system_message: System message marked as a prompt-cache prefix
 
 Dependencies:
     - openai
+    - asyncio
     - logging
+    - random
+    - threading
     - time
+    - weakref
 """
 
+import asyncio
 import logging
+import random
+import threading
 import time
-from typing import Any, Dict, Optional, Iterator
-
-from openai import OpenAI
+import weakref
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Dict, Iterator, Optional
+
+from openai import (
+    APIConnectionError,
+    AsyncOpenAI,
+    InternalServerError,
+    OpenAI,
+    RateLimitError,
+)
 
 from ..chat_model.model_settings import (
     BASE_URL,
     IS_RBC_ENV,
+    MAX_POOLED_CLIENTS,
     MAX_RETRY_ATTEMPTS,
+    PROMPT_CACHE_MARKERS,
     REQUEST_TIMEOUT,
     RETRY_DELAY_SECONDS,
+    RETRY_MAX_DELAY_SECONDS,
     TOKEN_PREVIEW_LENGTH,
 )
 
@@ -44,12 +64,68 @@ _token_usage = {
 }
 
 
+# Pooled API clients keyed by (token, base URL). Each client owns an HTTP
+# connection pool, so reusing it keeps connections alive between calls and only
+# the first request pays for the TCP and TLS handshakes. Async clients are bound
+# to the event loop that created them, so they are pooled per loop.
+_clients: "OrderedDict[tuple, OpenAI]" = OrderedDict()
+_async_clients: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_clients_lock = threading.Lock()
+
+
 class OpenAIConnectorError(Exception):
     """Base exception class for OpenAI connector errors."""
 
     pass
 
 
+def _pooled_client(pool: OrderedDict, key: tuple, factory) -> Any:
+    """Return the client for key from pool, creating it with factory on a miss."""
+    client = pool.get(key)
+    if client is None:
+        # Retries are handled by call_llm/acall_llm, so the SDK's own are disabled
+        client = factory(api_key=key[0], base_url=key[1], max_retries=0)
+        pool[key] = client
+        # Evicted clients are not closed here: another thread may still be using
+        # one, and its connections are released when it is garbage collected
+        while len(pool) > MAX_POOLED_CLIENTS:
+            pool.popitem(last=False)
+    pool.move_to_end(key)
+    return client
+
+
+def _get_client(oauth_token: str, api_base_url: str) -> OpenAI:
+    """
+    Get a pooled OpenAI client for the given token and endpoint.
+
+    Args:
+        oauth_token (str): OAuth token or API key used for the call
+        api_base_url (str): Base URL of the API endpoint
+
+    Returns:
+        OpenAI: Client reused across calls with the same token and endpoint
+    """
+    with _clients_lock:
+        return _pooled_client(_clients, (oauth_token, api_base_url), OpenAI)
+
+
+def _get_async_client(oauth_token: str, api_base_url: str) -> AsyncOpenAI:
+    """
+    Get a pooled AsyncOpenAI client for the running event loop.
+
+    Args:
+        oauth_token (str): OAuth token or API key used for the call
+        api_base_url (str): Base URL of the API endpoint
+
+    Returns:
+        AsyncOpenAI: Client reused across calls on the same loop, token and endpoint
+    """
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        pool = _async_clients.setdefault(loop, OrderedDict())
+        return _pooled_client(pool, (oauth_token, api_base_url), AsyncOpenAI)
+
+
 def calculate_cost(
     prompt_tokens: int,
     completion_tokens: int,
@@ -153,53 +229,82 @@ def log_usage_statistics(
     }
 
 
-def call_llm(
-    oauth_token: str,
-    prompt_token_cost: float = 0,
-    completion_token_cost: float = 0,
-    database_name: Optional[str] = None,
-    **params,
-) -> Any:  # Returns completion object or stream iterator
+# Errors worth retrying: rate limits, connection failures and timeouts, and 5xx
+# responses. Anything else (bad request, auth failure) fails on the first attempt.
+_TRANSIENT_ERRORS = (RateLimitError, APIConnectionError, InternalServerError)
+
+
+def _retry_delay(attempt: int, error: Optional[Exception] = None) -> float:
     """
-    Makes a call to the OpenAI API with the given parameters.
+    Exponential backoff delay with jitter before the next attempt.
 
-    This is a general-purpose function that handles all types of calls to the OpenAI API.
-    It works in both RBC and local environments.
+    When the failed response carried a Retry-After header (as rate-limit
+    responses usually do), the server's requested wait is used instead, capped
+    at RETRY_MAX_DELAY_SECONDS.
 
     Args:
-        oauth_token (str):
-            - In RBC environment: OAuth token for API authentication
-            - In local environment: OpenAI API key
-        prompt_token_cost (float): Cost per 1K prompt tokens in USD
-        completion_token_cost (float): Cost per 1K completion tokens in USD
-        database_name (str, optional): Identifier for database-specific tracking. Defaults to None.
-        **params: Parameters to pass to the OpenAI API
-            Required parameters:
-                - model (str): The model to use
-                - messages (list): The messages to send to the model
-            Optional parameters:
-                - stream (bool): Whether to stream the response
-                - tools (list): Tool definitions for tool calls
-                - tool_choice (dict/str): Tool choice specification
-                - temperature (float): Randomness parameter
-                - max_tokens (int): Maximum tokens for model response
-                - ... any other parameters supported by the OpenAI API
+        attempt (int): Number of the attempt that just failed (1-based)
+        error (Exception, optional): Error raised by the failed attempt
 
     Returns:
-        Any: OpenAI API response (completion object or a generator yielding stream chunks)
+        float: Seconds to wait, randomized so concurrent callers do not retry
+            in lockstep
+    """
+    response = getattr(error, "response", None)
+    retry_after = response.headers.get("retry-after") if response is not None else None
+    if retry_after is not None:
+        try:
+            return min(RETRY_MAX_DELAY_SECONDS, max(0.0, float(retry_after)))
+        except ValueError:
+            pass  # HTTP-date form; fall back to backoff
 
-    Raises:
-        OpenAIConnectorError: If the API call fails after all retry attempts
+    delay = min(RETRY_MAX_DELAY_SECONDS, RETRY_DELAY_SECONDS * 2 ** (attempt - 1))
+    return random.uniform(delay / 2, delay)
+
+
+def cacheable_system_message(content: str) -> Dict[str, Any]:
     """
-    attempts = 0
-    last_exception = None
+    Build a system message whose content is marked as a cacheable prefix.
 
-    # Set base URL for the API client (no query parameters here)
-    api_base_url = BASE_URL
+    Anthropic-format providers only cache prompts that carry an explicit
+    cache_control marker. OpenAI-format providers cache identical prefixes
+    automatically and reject the field, so unless PROMPT_CACHE_MARKERS is set
+    the message is built as plain text.
 
-    # Now create the OpenAI client with the properly formed URL
-    client = OpenAI(api_key=oauth_token, base_url=api_base_url)
+    Args:
+        content (str): Static system prompt text
 
+    Returns:
+        dict: System message with a single marked text block, or with plain
+            string content when PROMPT_CACHE_MARKERS is off
+    """
+    if not PROMPT_CACHE_MARKERS:
+        return {"role": "system", "content": content}
+
+    return {
+        "role": "system",
+        "content": [
+            {
+                "type": "text",
+                "text": content,
+                "cache_control": {"type": "ephemeral"},
+            }
+        ],
+    }
+
+
+def _prepare_request(oauth_token: str, api_base_url: str, params: Dict) -> bool:
+    """
+    Apply request defaults and log the call setup shared by sync and async calls.
+
+    Args:
+        oauth_token (str): OAuth token or API key used for the call
+        api_base_url (str): Base URL of the API endpoint
+        params (dict): Parameters for the chat completions call, updated in place
+
+    Returns:
+        bool: Whether the call is a streaming call
+    """
     # Log token preview for security
     token_preview = (
         oauth_token[:TOKEN_PREVIEW_LENGTH] + "..."
@@ -235,6 +340,59 @@ def call_llm(
         f"{' with tools' if has_tools else ''} in {env_type} environment"
     )
 
+    return is_streaming
+
+
+def call_llm(
+    oauth_token: str,
+    prompt_token_cost: float = 0,
+    completion_token_cost: float = 0,
+    database_name: Optional[str] = None,
+    **params,
+) -> Any:  # Returns completion object or stream iterator
+    """
+    Makes a call to the OpenAI API with the given parameters.
+
+    This is a general-purpose function that handles all types of calls to the OpenAI API.
+    It works in both RBC and local environments.
+
+    Args:
+        oauth_token (str):
+            - In RBC environment: OAuth token for API authentication
+            - In local environment: OpenAI API key
+        prompt_token_cost (float): Cost per 1K prompt tokens in USD
+        completion_token_cost (float): Cost per 1K completion tokens in USD
+        database_name (str, optional): Identifier for database-specific tracking. Defaults to None.
+        **params: Parameters to pass to the OpenAI API
+            Required parameters:
+                - model (str): The model to use
+                - messages (list): The messages to send to the model
+            Optional parameters:
+                - stream (bool): Whether to stream the response
+                - tools (list): Tool definitions for tool calls
+                - tool_choice (dict/str): Tool choice specification
+                - temperature (float): Randomness parameter
+                - max_tokens (int): Maximum tokens for model response
+                - ... any other parameters supported by the OpenAI API
+
+    Returns:
+        Any: OpenAI API response (completion object or a generator yielding stream chunks)
+
+    Raises:
+        OpenAIConnectorError: If the API call fails with a non-transient error or
+            after all retry attempts
+    """
+    attempts = 0
+    last_exception = None
+
+    # Set base URL for the API client (no query parameters here)
+    api_base_url = BASE_URL
+
+    # Reuse the pooled client (and its open connections) for this token and URL
+    client = _get_client(oauth_token, api_base_url)
+
+    is_streaming = _prepare_request(oauth_token, api_base_url, params)
+
     while attempts < MAX_RETRY_ATTEMPTS:
         attempt_start = time.time()
         attempts += 1
@@ -289,17 +447,111 @@ def call_llm(
                 f"Call attempt {attempts} failed after {attempt_time:.2f} seconds: {str(e)}"
             )
 
+            if not isinstance(e, _TRANSIENT_ERRORS):
+                break
+
             if attempts < MAX_RETRY_ATTEMPTS:
-                logger.info(f"Retrying in {RETRY_DELAY_SECONDS} seconds...")
-                time.sleep(RETRY_DELAY_SECONDS)
+                delay = _retry_delay(attempts, e)
+                logger.info(f"Retrying in {delay:.2f} seconds...")
+                time.sleep(delay)
 
-    # If we've exhausted all retries, raise the last exception
+    # If we've exhausted all retries (or hit a non-transient error), raise
     logger.error(f"Failed to complete call after {attempts} attempts")
     raise OpenAIConnectorError(
         f"Failed to complete OpenAI API call: {str(last_exception)}"
     )
 
 
+async def acall_llm(
+    oauth_token: str,
+    prompt_token_cost: float = 0,
+    completion_token_cost: float = 0,
+    database_name: Optional[str] = None,
+    **params,
+) -> Any:  # Returns completion object or async stream iterator
+    """
+    Makes an asynchronous call to the OpenAI API with the given parameters.
+
+    Mirrors call_llm, but awaits the request on the AsyncOpenAI client so the
+    event loop can serve other work while the call is in flight.
+
+    Args:
+        oauth_token (str):
+            - In RBC environment: OAuth token for API authentication
+            - In local environment: OpenAI API key
+        prompt_token_cost (float): Cost per 1K prompt tokens in USD
+        completion_token_cost (float): Cost per 1K completion tokens in USD
+        database_name (str, optional): Identifier for database-specific tracking. Defaults to None.
+        **params: Parameters to pass to the OpenAI API (see call_llm)
+
+    Returns:
+        Any: OpenAI API response (completion object or an async generator yielding stream chunks)
+
+    Raises:
+        OpenAIConnectorError: If the API call fails after all retry attempts
+    """
+    attempts = 0
+    last_exception = None
+
+    api_base_url = BASE_URL
+    client = _get_async_client(oauth_token, api_base_url)
+
+    is_streaming = _prepare_request(oauth_token, api_base_url, params)
+
+    while attempts < MAX_RETRY_ATTEMPTS:
+        attempt_start = time.time()
+        attempts += 1
+
+        try:
+            logger.info(
+                f"Attempt {attempts}/{MAX_RETRY_ATTEMPTS}: Sending async request to OpenAI API"
+            )
+
+            api_response = await client.chat.completions.create(**params)
+
+            elapsed_time = time.time() - attempt_start
+            logger.info(
+                f"Received {'initial stream chunk' if is_streaming else 'response'} in {elapsed_time:.2f} seconds"
+            )
+
+            if is_streaming:
+                return _astream_wrapper(
+                    api_response,
+                    prompt_token_cost,
+                    completion_token_cost,
+                    database_name,
+                )
+
+            if prompt_token_cost and completion_token_cost:
+                log_usage_statistics(
+                    api_response,
+                    prompt_token_cost,
+                    completion_token_cost,
+                    database_name=database_name,
+                )
+            return api_response
+
+        except Exception as e:
+            last_exception = e
+            attempt_time = time.time() - attempt_start
+            logger.warning(
+                f"Async call attempt {attempts} failed after {attempt_time:.2f} seconds: {str(e)}"
+            )
+
+            if not isinstance(e, _TRANSIENT_ERRORS):
+                break
+
+            if attempts < MAX_RETRY_ATTEMPTS:
+                delay = _retry_delay(attempts, e)
+                logger.info(f"Retrying in {delay:.2f} seconds...")
+                await asyncio.sleep(delay)
+
+    logger.error(f"Failed to complete async call after {attempts} attempts")
+    raise OpenAIConnectorError(
+        f"Failed to complete OpenAI API call: {str(last_exception)}"
+    )
+
+
 # Helper generator for streaming responses to log usage at the end
 def _stream_wrapper(
     stream: Iterator,
@@ -314,6 +566,9 @@ def _stream_wrapper(
             yield chunk
             last_chunk = chunk  # Keep track of the last chunk
     finally:
+        # Release the HTTP connection if the caller stopped reading early
+        stream.close()
+
         # After the stream is exhausted (or loop breaks), check the last chunk for usage
         if last_chunk and hasattr(last_chunk, "usage") and last_chunk.usage:
             logger.info("Stream finished. Logging usage from final chunk.")
@@ -330,6 +585,36 @@ def _stream_wrapper(
             )
 
 
+async def _astream_wrapper(
+    stream: AsyncIterator,
+    prompt_token_cost: float,
+    completion_token_cost: float,
+    database_name: Optional[str] = None,
+) -> AsyncIterator:
+    """Wraps the async OpenAI stream to log usage statistics after completion."""
+    last_chunk = None
+    try:
+        async for chunk in stream:
+            yield chunk
+            last_chunk = chunk
+    finally:
+        await stream.close()
+
+        if last_chunk and hasattr(last_chunk, "usage") and last_chunk.usage:
+            logger.info("Async stream finished. Logging usage from final chunk.")
+            log_usage_statistics(
+                response=None,
+                prompt_token_cost=prompt_token_cost,
+                completion_token_cost=completion_token_cost,
+                database_name=database_name,
+                usage_data=last_chunk.usage,
+            )
+        else:
+            logger.warning(
+                "Async stream finished, but no usage data found in the final chunk."
+            )
+
+
 def get_token_usage() -> Dict[str, Any]:
     """
     Get the current token usage statistics.
@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+"""
+Script to check clarifier decisions against canned conversations.
+
+Run this after editing the clarifier prompt (CLARIFIER_TASK) to confirm the
+model still makes the expected decision for the documented examples, including
+the override phrases that must always skip clarification. The conversations
+live in tests/data/clarifier_decisions.json, where the unit tests also check
+the local fast path against them. By default every conversation is sent
+straight to the model, skipping the fast path and decision cache; pass
+--with-fast-path to check the decisions users actually receive instead.
+
+Usage:
+    python scripts/check_clarifier_decisions.py [--with-fast-path]
+"""
+
+import sys
+import os
+
+# Add project root to path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(project_root)
+
+import orjson
+
+from iris.src.agents.agent_clarifier.clarifier import (
+    ClarifierError,
+    clarify_research_needs,
+    llm_params,
+    parse_decision,
+    prepare_messages,
+)
+from iris.src.initial_setup.logging_config import configure_logging
+from iris.src.initial_setup.oauth.oauth import setup_oauth
+from iris.src.initial_setup.ssl.ssl import setup_ssl
+from iris.src.llm_connectors.rbc_openai import OpenAIConnectorError, call_llm
+
+# Canned conversations shared with tests/test_clarifier_decisions.py
+CASES_PATH = os.path.join(project_root, "tests", "data", "clarifier_decisions.json")
+
+
+def load_cases():
+    """Load the canned conversations and their expected decisions."""
+    with open(CASES_PATH, "rb") as f:
+        return orjson.loads(f.read())
+
+
+def model_decision(conversation, token):
+    """
+    Ask the model for a decision, bypassing the fast path and decision cache.
+
+    Args:
+        conversation (dict): Conversation with 'messages' key
+        token (str): Authentication token for API access
+
+    Returns:
+        dict: Clarifier decision parsed from the model response
+
+    Raises:
+        ClarifierError: If the LLM call fails or returns no valid decision
+    """
+    messages = prepare_messages(conversation)
+    try:
+        response = call_llm(**llm_params(messages, token))
+    except OpenAIConnectorError as e:
+        raise ClarifierError(f"Failed to clarify research needs: {str(e)}") from e
+    return parse_decision(response, messages)
+
+
+def check_decisions(with_fast_path=False):
+    """
+    Run the canned conversations through the clarifier and report mismatches.
+
+    Args:
+        with_fast_path (bool): Whether to go through clarify_research_needs as
+            configured, so the fast path and cache may decide requests
+
+    Returns:
+        int: Number of conversations whose decision did not match
+    """
+    configure_logging()
+    setup_ssl()
+    token = setup_oauth()
+    decide = clarify_research_needs if with_fast_path else model_decision
+
+    cases = load_cases()
+    failures = 0
+    for case in cases:
+        description = case["description"]
+        expected_action = case["action"]
+        expected_scope = case["scope"]
+        try:
+            decision = decide({"messages": case["messages"]}, token)
+        except ClarifierError as e:
+            failures += 1
+            print(f"ERROR    {description}: {e}")
+            continue
+
+        problems = []
+        if decision["action"] != expected_action:
+            problems.append(f"action {decision['action']} != {expected_action}")
+        if expected_scope and decision.get("scope") != expected_scope:
+            problems.append(f"scope {decision.get('scope')} != {expected_scope}")
+
+        if problems:
+            failures += 1
+            print(f"MISMATCH {description}: {'; '.join(problems)}")
+            print(f"         output: {decision['output']}")
+        else:
+            print(f"OK       {description}")
+
+    print(f"\n{len(cases) - failures}/{len(cases)} decisions matched")
+    return failures
+
+
+if __name__ == "__main__":
+    sys.exit(1 if check_decisions("--with-fast-path" in sys.argv[1:]) else 0)
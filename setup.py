@@ -6,6 +6,7 @@ setup(
     packages=find_packages(),
     install_requires=[
         "openai",
+        "orjson",
         "requests",
         "cryptography",
         "psycopg2-binary",
@@ -0,0 +1,72 @@
+"""Tests for concurrent batch clarification."""
+
+import asyncio
+from types import SimpleNamespace
+
+import orjson
+import pytest
+
+from iris.src.agents.agent_clarifier import clarifier, clarifier_batch
+from iris.src.agents.response_cache import ResponseCache
+
+TOOL_NAME = clarifier.TOOL_DEFINITIONS[0]["function"]["name"]
+
+
+def _decision_response():
+    """Build a chat completion carrying a research-statement decision."""
+    arguments = {
+        "action": "create_research_statement",
+        "output": "Research focusing on IFRS 15 contract modifications.",
+        "scope": "research",
+    }
+    function = SimpleNamespace(name=TOOL_NAME, arguments=orjson.dumps(arguments))
+    message = SimpleNamespace(tool_calls=[SimpleNamespace(function=function)])
+    return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+@pytest.fixture
+def in_flight(monkeypatch):
+    """Stub acall_llm and record the peak number of concurrent calls."""
+    state = {"current": 0, "peak": 0, "calls": 0}
+
+    async def fake_acall_llm(**params):
+        state["current"] += 1
+        state["calls"] += 1
+        state["peak"] = max(state["peak"], state["current"])
+        await asyncio.sleep(0.01)
+        state["current"] -= 1
+        return _decision_response()
+
+    monkeypatch.setattr(clarifier, "acall_llm", fake_acall_llm)
+    monkeypatch.setattr(clarifier, "FAST_PATH_ENABLED", False)
+    monkeypatch.setattr(clarifier, "_decision_cache", ResponseCache())
+    return state
+
+
+def _conversations(count):
+    return [
+        {"messages": [{"role": "user", "content": f"IFRS 15 question {i}"}]}
+        for i in range(count)
+    ]
+
+
+def test_batch_concurrency_is_capped_by_clarifier_concurrency(in_flight):
+    count = clarifier.CLARIFIER_CONCURRENCY * 3
+    results = clarifier_batch.clarify_research_needs_batch(
+        _conversations(count), "token"
+    )
+
+    assert len(results) == count
+    assert all(r["action"] == "create_research_statement" for r in results)
+    assert in_flight["calls"] == count
+    assert in_flight["peak"] == clarifier.CLARIFIER_CONCURRENCY
+
+
+def test_batch_returns_errors_in_place(in_flight, monkeypatch):
+    async def failing_acall_llm(**params):
+        raise clarifier.OpenAIConnectorError("boom")
+
+    monkeypatch.setattr(clarifier, "acall_llm", failing_acall_llm)
+    results = clarifier_batch.clarify_research_needs_batch(_conversations(2), "token")
+
+    assert all(isinstance(r, clarifier.ClarifierError) for r in results)
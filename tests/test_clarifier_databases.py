@@ -0,0 +1,45 @@
+"""Tests for narrowing the clarifier prompt to databases the user names."""
+
+import pytest
+
+from iris.src.agents.agent_clarifier.clarifier import _requested_databases
+
+
+def _latest(text):
+    return [{"role": "user", "content": text}]
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Draft a memo on IFRS 16 lease modifications",
+        "Give me a cheat sheet for IFRS 15 revenue recognition",
+        "Hey, what does the standard say about hedge accounting?",
+        "Is there a wiki article on impairment?",
+        "How does CAPM relate to the discount rate under IAS 36?",
+    ],
+)
+def test_everyday_words_do_not_narrow_the_prompt(text):
+    assert _requested_databases(_latest(text)) is None
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("Check the internal memos on leases", ("internal_memos",)),
+        ("What does the EY guidance say about IFRS 9?", ("external_ey",)),
+        ("Can you check the IASB guidance on leases?", ("external_iasb",)),
+        ("Look in the policy manual for capitalization", ("internal_capm",)),
+        ("Compare KPMG and PwC views on IFRS 17", ("external_kpmg", "external_pwc")),
+    ],
+)
+def test_explicit_database_phrases_narrow_the_prompt(text, expected):
+    assert _requested_databases(_latest(text)) == expected
+
+
+def test_only_the_latest_user_message_is_scanned():
+    messages = [
+        {"role": "user", "content": "Check the internal memos on leases"},
+        {"role": "assistant", "content": "Which lease arrangement?"},
+    ]
+    assert _requested_databases(messages) is None
@@ -0,0 +1,36 @@
+"""Tests that the fast path agrees with the canned clarifier decisions.
+
+The same conversations are replayed against the model by
+scripts/check_clarifier_decisions.py after prompt edits.
+"""
+
+from pathlib import Path
+
+import orjson
+import pytest
+
+from iris.src.agents.agent_clarifier.fast_path import fast_path_decision
+
+CASES = orjson.loads(
+    (Path(__file__).parent / "data" / "clarifier_decisions.json").read_bytes()
+)
+
+
+@pytest.mark.parametrize("case", CASES, ids=[case["description"] for case in CASES])
+def test_fast_path_never_contradicts_expected_decision(case):
+    decision = fast_path_decision({"messages": case["messages"]})
+    if decision is None:
+        return
+
+    assert decision["action"] == case["action"]
+    if case["scope"]:
+        assert decision["scope"] == case["scope"]
+
+
+def test_override_cases_are_left_to_the_model():
+    overrides = [c for c in CASES if c["description"].startswith("override:")]
+
+    assert overrides
+    assert all(
+        fast_path_decision({"messages": c["messages"]}) is None for c in overrides
+    )
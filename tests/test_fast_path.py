@@ -0,0 +1,178 @@
+"""Tests for the clarifier fast path."""
+
+import pytest
+
+from iris.src.agents.agent_clarifier.fast_path import (
+    detect_continuation,
+    fast_path_decision,
+)
+
+
+def _decide(text):
+    return fast_path_decision({"messages": [{"role": "user", "content": text}]})
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Tell me about revenue recognition, no more clarification",
+        "What's the definition of a lease? just search, no clarification needed",
+        "Is this allowed? Skip clarification, just search",
+        "What is this? I can't provide more detail",
+    ],
+)
+def test_override_phrases_go_to_the_model(text):
+    assert _decide(text) is None
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "How do we handle this?",
+        "What are the requirements for this?",
+        "Is that allowed?",
+    ],
+)
+def test_short_vague_requests_ask_for_context(text):
+    decision = _decide(text)
+
+    assert decision["action"] == "request_essential_context"
+    assert decision["scope"] is None
+    assert decision["output"].startswith("1. ")
+
+
+def test_long_vague_requests_go_to_the_model():
+    assert _decide("What would the accounting be for this if we did it?") is None
+
+
+def test_every_named_standard_is_kept():
+    decision = _decide("Compare IFRS 15 with US GAAP ASC 606")
+
+    assert decision["action"] == "create_research_statement"
+    assert decision["scope"] == "research"
+    assert decision["output"] == (
+        "Research focusing on IFRS 15 and US GAAP ASC 606, "
+        "answering: Compare IFRS 15 with US GAAP ASC 606."
+    )
+
+
+def test_repeated_standard_is_named_once():
+    decision = _decide("Does ifrs 16 or IFRS 16 cover short-term leases?")
+
+    assert decision["output"].startswith("Research focusing on IFRS 16, answering:")
+
+
+def test_topic_without_standard_states_the_ifrs_assumption():
+    decision = _decide("I need guidance on hedge accounting requirements.")
+
+    assert decision["output"] == (
+        "Research focusing on IFRS regarding hedge accounting, answering: "
+        "I need guidance on hedge accounting requirements. "
+        "No accounting standard was specified, so IFRS is assumed."
+    )
+
+
+def test_named_standard_does_not_state_the_ifrs_assumption():
+    decision = _decide("How does IFRS 15 handle contract modifications?")
+
+    assert "IFRS is assumed" not in decision["output"]
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Find documents about IFRS 16 lease accounting",
+        "List the internal memos on IFRS 9 impairment",
+        "Which documents cover IFRS 17?",
+        "Are there any articles on revenue recognition?",
+        "Search for guidance papers on IAS 36",
+    ],
+)
+def test_catalog_requests_get_metadata_scope(text):
+    decision = _decide(text)
+
+    assert decision["scope"] == "metadata"
+    assert decision["output"].startswith("Identify documents related to ")
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "How does IFRS 15 handle contract modifications?",
+        "What items of PP&E are depreciated under IAS 16?",
+        "What sources of estimation uncertainty does IAS 1 require us to disclose?",
+        "Explain impairment testing for goodwill",
+    ],
+)
+def test_content_questions_get_research_scope(text):
+    assert _decide(text)["scope"] == "research"
+
+
+def test_follow_up_requests_go_to_the_model():
+    conversation = {
+        "messages": [
+            {"role": "user", "content": "Find documents about IFRS 16"},
+            {"role": "assistant", "content": "* **Lease memo** (ID: `m1`)"},
+            {"role": "user", "content": "Analyze the lease memo under IFRS 16"},
+        ]
+    }
+    assert fast_path_decision(conversation) is None
+
+
+def _conversation(*turns):
+    roles = ["user", "assistant"]
+    return [
+        {"role": roles[i % 2], "content": content} for i, content in enumerate(turns)
+    ]
+
+
+def test_proceed_after_an_ordinary_answer_is_not_a_continuation():
+    messages = _conversation(
+        "What does IFRS 16 say about short-term leases?",
+        "IFRS 16 lets lessees elect not to recognise short-term leases.",
+        "How should I proceed with the election for our vehicle fleet?",
+    )
+    assert detect_continuation(messages) is False
+
+
+def test_reply_to_numbered_clarifier_questions_is_a_continuation():
+    messages = _conversation(
+        "What's the accounting treatment for this?",
+        "1. Which transaction or balance are you asking about?\n"
+        "2. Which accounting standard applies?",
+        "A sale and leaseback of our head office under IFRS 16",
+    )
+    assert detect_continuation(messages) is True
+
+
+def test_go_ahead_after_clarifier_questions_is_a_continuation():
+    messages = _conversation(
+        "What are the requirements for this?",
+        "1. Which accounting topic or standard is this about?",
+        "Just go ahead with IFRS",
+    )
+    assert detect_continuation(messages) is True
+
+
+def test_system_messages_are_ignored_when_finding_the_previous_reply():
+    messages = [
+        {"role": "system", "content": "Static prompt"},
+        *_conversation(
+            "What are the requirements for this?",
+            "1. Which accounting topic or standard is this about?",
+            "Revenue recognition",
+        ),
+    ]
+    assert detect_continuation(messages) is True
+
+
+@pytest.mark.parametrize(
+    "messages",
+    [
+        [],
+        _conversation("Please continue the IFRS 15 research"),
+        _conversation("What is IFRS 15?", "1. Which aspect?"),
+    ],
+)
+def test_no_continuation_without_a_preceding_clarifier_question(messages):
+    assert detect_continuation(messages) is False
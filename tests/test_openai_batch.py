@@ -0,0 +1,201 @@
+"""Tests for the Batch API connector."""
+
+from types import SimpleNamespace
+
+import orjson
+import pytest
+
+from iris.src.llm_connectors import openai_batch
+from iris.src.llm_connectors.rbc_openai import OpenAIConnectorError
+
+
+def _completion_body(content):
+    return {
+        "id": "chatcmpl-1",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "model",
+        "choices": [
+            {
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": content},
+            }
+        ],
+    }
+
+
+def _result_line(custom_id, status_code=200, body=None, error=None):
+    return orjson.dumps(
+        {
+            "custom_id": custom_id,
+            "response": {"status_code": status_code, "body": body},
+            "error": error,
+        }
+    )
+
+
+class FakeClient:
+    """Stand-in for the pooled OpenAI client's files and batches endpoints."""
+
+    def __init__(self, statuses=("completed",), output=b"", output_file_id="out"):
+        self.statuses = list(statuses)
+        self.output = output
+        self.output_file_id = output_file_id
+        self.uploads = []
+        self.created = []
+        self.retrieved = 0
+        self.files = SimpleNamespace(create=self._create_file, content=self._content)
+        self.batches = SimpleNamespace(
+            create=self._create_batch, retrieve=self._retrieve
+        )
+
+    def _create_file(self, file, purpose):
+        self.uploads.append((file, purpose))
+        return SimpleNamespace(id="file-in")
+
+    def _create_batch(self, **kwargs):
+        self.created.append(kwargs)
+        return SimpleNamespace(id="batch-1")
+
+    def _retrieve(self, batch_id):
+        status = self.statuses[min(self.retrieved, len(self.statuses) - 1)]
+        self.retrieved += 1
+        return SimpleNamespace(
+            status=status,
+            output_file_id=self.output_file_id if status == "completed" else None,
+        )
+
+    def _content(self, file_id):
+        return SimpleNamespace(content=self.output)
+
+
+class FakeClock:
+    """Stand-in for time.monotonic and time.sleep that advances on sleep."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(openai_batch.time, "monotonic", fake.monotonic)
+    monkeypatch.setattr(openai_batch.time, "sleep", fake.sleep)
+    return fake
+
+
+def _use_client(monkeypatch, client):
+    tokens = []
+
+    def fake_get_client(oauth_token, api_base_url):
+        tokens.append(oauth_token)
+        return client
+
+    monkeypatch.setattr(openai_batch, "_get_client", fake_get_client)
+    return tokens
+
+
+def _collect(request_count, max_wait=60):
+    return openai_batch.collect_batch(
+        "planner", "batch-1", "token", request_count, 10, max_wait
+    )
+
+
+def test_submit_uploads_one_jsonl_line_per_request(monkeypatch):
+    client = FakeClient()
+    tokens = _use_client(monkeypatch, client)
+    params = {
+        "oauth_token": "token",
+        "prompt_token_cost": 0.1,
+        "completion_token_cost": 0.2,
+        "stream": False,
+        "model": "model",
+        "messages": [{"role": "user", "content": "IFRS 15"}],
+    }
+
+    batch_id = openai_batch.submit_batch("planner", [params, params], "token", "24h")
+
+    assert batch_id == "batch-1"
+    assert tokens == ["token"]
+    (filename, payload), purpose = client.uploads[0]
+    assert (filename, purpose) == ("planner_batch.jsonl", "batch")
+    lines = [orjson.loads(line) for line in payload.splitlines()]
+    assert [line["custom_id"] for line in lines] == ["planner-0", "planner-1"]
+    assert lines[0]["url"] == openai_batch.BATCH_ENDPOINT
+    assert lines[0]["body"] == {
+        "model": "model",
+        "messages": [{"role": "user", "content": "IFRS 15"}],
+    }
+    assert client.created == [
+        {
+            "input_file_id": "file-in",
+            "endpoint": openai_batch.BATCH_ENDPOINT,
+            "completion_window": "24h",
+        }
+    ]
+
+
+def test_collect_maps_results_and_errors_by_custom_id(monkeypatch, clock):
+    output = b"\n".join(
+        [
+            _result_line("planner-2", body=_completion_body("third")),
+            _result_line("planner-0", body=_completion_body("first")),
+            _result_line("planner-1", status_code=429, body={"error": "rate"}),
+            _result_line("planner-3", body={"unexpected": True}),
+            _result_line("planner-4", error={"message": "expired"}),
+            b"",
+        ]
+    )
+    _use_client(monkeypatch, FakeClient(output=output))
+
+    results = _collect(6)
+
+    assert [r.choices[0].message.content for r in (results[0], results[2])] == [
+        "first",
+        "third",
+    ]
+    assert "Batch request failed" in str(results[1])
+    assert "Malformed batch response" in str(results[3])
+    assert "expired" in str(results[4])
+    assert str(results[5]) == "No result returned for this request"
+    assert all(isinstance(r, OpenAIConnectorError) for r in (results[1], *results[3:]))
+
+
+def test_collect_polls_until_the_job_finishes(monkeypatch, clock):
+    client = FakeClient(
+        statuses=("validating", "in_progress", "completed"),
+        output=_result_line("planner-0", body=_completion_body("done")),
+    )
+    _use_client(monkeypatch, client)
+
+    results = _collect(1)
+
+    assert results[0].choices[0].message.content == "done"
+    assert clock.sleeps == [10, 10]
+
+
+def test_collect_raises_when_job_has_no_output(monkeypatch, clock):
+    _use_client(monkeypatch, FakeClient(statuses=("failed",)))
+
+    with pytest.raises(OpenAIConnectorError, match="'failed' and no output"):
+        _collect(1)
+
+
+def test_collect_gives_up_after_max_wait(monkeypatch, clock):
+    client = FakeClient(statuses=("in_progress",))
+    _use_client(monkeypatch, client)
+
+    with pytest.raises(OpenAIConnectorError, match="still 'in_progress'"):
+        _collect(1, max_wait=25)
+
+    assert clock.sleeps == [10, 10, 5]
+    assert clock.now == 25
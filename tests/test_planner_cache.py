@@ -0,0 +1,108 @@
+"""Tests for the planner's exact-match and opt-in near-duplicate plan caches."""
+
+from types import SimpleNamespace
+
+import orjson
+import pytest
+
+from iris.src.agents.agent_planner import planner
+from iris.src.agents.response_cache import ResponseCache, SemanticResponseCache
+
+DATABASE = next(iter(planner.AVAILABLE_DATABASES))
+
+
+def _plan_response(databases):
+    """Build a chat completion carrying a planner tool call."""
+    function = SimpleNamespace(
+        name=planner.PLANNER_TOOL_NAME,
+        arguments=orjson.dumps({"databases": databases}).decode(),
+    )
+    message = SimpleNamespace(tool_calls=[SimpleNamespace(function=function)])
+    return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+@pytest.fixture
+def llm_calls(monkeypatch):
+    """Stub call_llm, recording each call, and start from an empty plan cache."""
+    calls = []
+
+    def fake_call_llm(**params):
+        calls.append(params)
+        return _plan_response([DATABASE])
+
+    monkeypatch.setattr(planner, "call_llm", fake_call_llm)
+    monkeypatch.setattr(planner, "_plan_cache", ResponseCache())
+    return calls
+
+
+def test_semantic_cache_is_off_by_default():
+    assert planner.SEMANTIC_CACHE_ENABLED is False
+    assert planner._semantic_plan_cache is None
+
+
+def test_identical_statement_served_from_exact_cache(llm_calls, monkeypatch):
+    monkeypatch.setattr(planner, "_semantic_plan_cache", None)
+
+    first = planner.create_database_selection_plan("IFRS 15 revenue", "token")
+    second = planner.create_database_selection_plan("IFRS 15 revenue", "token")
+
+    assert first == second == {"databases": [DATABASE]}
+    assert len(llm_calls) == 1
+
+
+def test_reworded_statement_misses_without_semantic_cache(llm_calls, monkeypatch):
+    monkeypatch.setattr(planner, "_semantic_plan_cache", None)
+
+    planner.create_database_selection_plan(
+        "Revenue recognition for contract modifications under IFRS 15", "token"
+    )
+    planner.create_database_selection_plan(
+        "Under IFRS 15, revenue recognition for contract modifications", "token"
+    )
+
+    assert len(llm_calls) == 2
+
+
+def test_reworded_statement_reuses_plan_when_enabled(llm_calls, monkeypatch):
+    monkeypatch.setattr(planner, "_semantic_plan_cache", SemanticResponseCache())
+
+    planner.create_database_selection_plan(
+        "Revenue recognition for contract modifications under IFRS 15", "token"
+    )
+    plan = planner.create_database_selection_plan(
+        "Under IFRS 15, revenue recognition for contract modifications", "token"
+    )
+
+    assert plan == {"databases": [DATABASE]}
+    assert len(llm_calls) == 1
+
+
+def test_different_standard_number_is_not_reused(llm_calls, monkeypatch):
+    monkeypatch.setattr(planner, "_semantic_plan_cache", SemanticResponseCache())
+
+    planner.create_database_selection_plan(
+        "Revenue recognition for contract modifications under IFRS 15", "token"
+    )
+    planner.create_database_selection_plan(
+        "Revenue recognition for contract modifications under IFRS 16", "token"
+    )
+
+    assert len(llm_calls) == 2
+
+
+def test_prompt_change_invalidates_semantic_entries(llm_calls, monkeypatch):
+    monkeypatch.setattr(planner, "_semantic_plan_cache", SemanticResponseCache())
+
+    planner.create_database_selection_plan(
+        "Revenue recognition for contract modifications under IFRS 15", "token"
+    )
+    monkeypatch.setattr(
+        planner,
+        "_system_message",
+        lambda: {"role": "system", "content": "Revised planner prompt"},
+    )
+    planner.create_database_selection_plan(
+        "Under IFRS 15, revenue recognition for contract modifications", "token"
+    )
+
+    assert len(llm_calls) == 2
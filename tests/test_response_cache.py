@@ -0,0 +1,216 @@
+"""Tests for the shared agent response caches."""
+
+import re
+
+import pytest
+
+from iris.src.agents import response_cache
+from iris.src.agents.response_cache import (
+    DiskResponseCache,
+    ResponseCache,
+    SemanticResponseCache,
+    make_cache_key,
+)
+
+SYSTEM = {"role": "system", "content": "You are the clarifier."}
+TOOLS_JSON = b'[{"type": "function"}]'
+TOOL_CHOICE = {"type": "function", "function": {"name": "decide"}}
+
+
+class FakeClock:
+    """Stand-in for time.monotonic and time.time that only moves when told."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(response_cache.time, "monotonic", fake)
+    monkeypatch.setattr(response_cache.time, "time", fake)
+    return fake
+
+
+def _messages(text):
+    return [SYSTEM, {"role": "user", "content": text}]
+
+
+# make_cache_key
+
+
+def test_cache_key_is_stable_across_dict_ordering():
+    first = make_cache_key(
+        "model", [{"role": "user", "content": "hi"}], TOOLS_JSON, TOOL_CHOICE
+    )
+    second = make_cache_key(
+        "model",
+        [{"content": "hi", "role": "user"}],
+        TOOLS_JSON,
+        {"function": {"name": "decide"}, "type": "function"},
+    )
+    assert first == second
+
+
+@pytest.mark.parametrize(
+    "model, messages, tools_json",
+    [
+        ("other-model", _messages("hi"), TOOLS_JSON),
+        ("model", _messages("hello"), TOOLS_JSON),
+        ("model", _messages("hi"), b"[]"),
+    ],
+)
+def test_cache_key_changes_with_any_request_part(model, messages, tools_json):
+    base = make_cache_key("model", _messages("hi"), TOOLS_JSON, TOOL_CHOICE)
+    assert make_cache_key(model, messages, tools_json, TOOL_CHOICE) != base
+
+
+# ResponseCache
+
+
+def test_hit_returns_a_copy(clock):
+    cache = ResponseCache()
+    cache.set("key", {"action": "create_research_statement"})
+
+    hit = cache.get("key")
+    hit["action"] = "changed"
+
+    assert cache.get("key") == {"action": "create_research_statement"}
+
+
+def test_stored_value_is_copied(clock):
+    cache = ResponseCache()
+    response = {"action": "create_research_statement"}
+    cache.set("key", response)
+    response["action"] = "changed"
+
+    assert cache.get("key") == {"action": "create_research_statement"}
+
+
+def test_entries_expire_after_their_ttl(clock):
+    cache = ResponseCache(default_ttl=10)
+    cache.set("default", {"a": 1})
+    cache.set("custom", {"a": 2}, ttl=30)
+
+    clock.now += 10
+    assert cache.get("default") is None
+    assert cache.get("custom") == {"a": 2}
+
+    clock.now += 20
+    assert cache.get("custom") is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    cache = ResponseCache(max_entries=2)
+    cache.set("a", {"v": 1})
+    cache.set("b", {"v": 2})
+    cache.get("a")
+    cache.set("c", {"v": 3})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"v": 1}
+    assert cache.get("c") == {"v": 3}
+
+
+# SemanticResponseCache
+
+
+def test_reworded_request_is_a_hit(clock):
+    cache = SemanticResponseCache(threshold=0.9)
+    cache.set(
+        "model", _messages("How does IFRS 15 handle contract modifications?"), {"v": 1}
+    )
+
+    hit = cache.get(
+        "model", _messages("how does IFRS 15 handle contract modifications")
+    )
+    assert hit == {"v": 1}
+
+    hit["v"] = 2
+    assert cache.get(
+        "model", _messages("How does IFRS 15 handle contract modifications?")
+    ) == {"v": 1}
+
+
+@pytest.mark.parametrize(
+    "stored, asked",
+    [
+        (
+            "How does IFRS 15 handle contract modifications?",
+            "How does IFRS 16 handle contract modifications?",
+        ),
+        (
+            "Is early adoption allowed under IFRS 17?",
+            "Is early adoption not allowed under IFRS 17?",
+        ),
+        (
+            "Is early adoption allowed under IFRS 17?",
+            "Isn't early adoption allowed under IFRS 17?",
+        ),
+        (
+            "What are the IFRS disclosure requirements for leases?",
+            "What are the ASPE disclosure requirements for leases?",
+        ),
+    ],
+)
+def test_requests_differing_in_exact_terms_never_match(clock, stored, asked):
+    cache = SemanticResponseCache(threshold=0.5)
+    cache.set("model", _messages(stored), {"v": 1})
+
+    assert cache.get("model", _messages(asked)) is None
+
+
+def test_different_context_or_model_misses(clock):
+    cache = SemanticResponseCache()
+    cache.set("model", _messages("IFRS 15 contract modifications"), {"v": 1})
+
+    other_context = [
+        {"role": "system", "content": "You are the planner."},
+        {"role": "user", "content": "IFRS 15 contract modifications"},
+    ]
+    assert cache.get("model", other_context) is None
+    assert cache.get("other-model", _messages("IFRS 15 contract modifications")) is None
+
+
+def test_bypass_pattern_skips_the_cache(clock):
+    cache = SemanticResponseCache(bypass_pattern=re.compile(r"\bcontinue\b", re.I))
+    cache.set("model", _messages("Please continue the IFRS 15 research"), {"v": 1})
+
+    assert len(cache) == 0
+    assert cache.get("model", _messages("Please continue the IFRS 15 research")) is None
+
+
+def test_semantic_entries_expire(clock):
+    cache = SemanticResponseCache(default_ttl=10)
+    cache.set("model", _messages("IFRS 15 contract modifications"), {"v": 1})
+
+    clock.now += 10
+    assert cache.get("model", _messages("IFRS 15 contract modifications")) is None
+
+
+# DiskResponseCache
+
+
+def test_disk_cache_round_trip_and_expiry(tmp_path, clock):
+    cache = DiskResponseCache(str(tmp_path), default_ttl=10)
+    cache.set("key", {"action": "create_research_statement"})
+
+    reopened = DiskResponseCache(str(tmp_path))
+    assert reopened.get("key") == {"action": "create_research_statement"}
+    assert reopened.get("missing") is None
+
+    clock.now += 10
+    assert reopened.get("key") is None
+
+
+def test_unusable_disk_cache_directory_is_a_miss(tmp_path):
+    blocker = tmp_path / "not-a-directory"
+    blocker.write_text("")
+    cache = DiskResponseCache(str(blocker / "cache"))
+
+    cache.set("key", {"v": 1})
+    assert cache.get("key") is None